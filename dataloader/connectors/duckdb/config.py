@@ -23,6 +23,17 @@ class DuckDBConnectorConfig(BaseModel):
     table: str = Field(description="Table name")
     db_schema: Optional[str] = Field(default=None, description="Database schema")
 
+    # Database settings (applied when the database is opened)
+    threads: Optional[int] = Field(
+        default=None, description="Number of DuckDB worker threads"
+    )
+    memory_limit: Optional[str] = Field(
+        default=None, description="DuckDB memory limit (e.g., '4GB')"
+    )
+    temp_directory: Optional[str] = Field(
+        default=None, description="Directory DuckDB spills to when over memory_limit"
+    )
+
     # Source-specific fields (for reading)
     incremental: Optional[IncrementalConfig] = Field(
         default=None, description="Incremental loading configuration (for reads)"
@@ -36,6 +47,14 @@ class DuckDBConnectorConfig(BaseModel):
         default=None,
         description="Key columns for merge mode (required when write_mode='merge')",
     )
+    preserve_insertion_order: bool = Field(
+        default=False,
+        description=(
+            "Keep rows in load order when writing. Disabled by default for faster "
+            "bulk loads; enable if consumers rely on unordered scans returning "
+            "rows in insertion order (for writes)"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_fields(self):
@@ -1,15 +1,15 @@
 """DuckDB connector for reading and writing data."""
 
-from typing import Any, Iterable, Union
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from dataloader.connectors.registry import ConnectorConfigUnion, register_connector
 
-try:
-    import duckdb
+if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection
-except ImportError:
-    duckdb = None  # type: ignore
-    DuckDBPyConnection = None  # type: ignore
 
 import pyarrow as pa
 
@@ -22,9 +22,39 @@ from dataloader.models.source_config import SourceConfig
 from .config import DuckDBConnectorConfig
 from .type_mapper import DuckDBTypeMapper
 
+# duckdb is imported on first connector construction (see _import_duckdb) so that
+# importing dataloader does not pay its start-up cost when DuckDB is never used.
+duckdb: Any = None
+
 # Default batch size for reading
 DEFAULT_BATCH_SIZE = 1000
 
+# Name of the connection-local view Arrow batches are registered under for inserts
+STAGING_VIEW = "__dataloader_staging"
+
+
+@functools.lru_cache(maxsize=64)
+def _placeholders(count: int) -> str:
+    """Return the ``?, ?, ...`` parameter list for ``count`` columns."""
+    return ", ".join(["?"] * count)
+
+
+@functools.lru_cache(maxsize=64)
+def _quote_columns(columns: tuple[str, ...]) -> str:
+    """Return the comma-separated, double-quoted column list for ``columns``."""
+    return ", ".join(f'"{col}"' for col in columns)
+
+
+def _import_duckdb() -> Any:
+    """Import duckdb on first use and bind it to the module-level name."""
+    global duckdb
+    if duckdb is None:
+        try:
+            import duckdb
+        except ImportError:
+            return None
+    return duckdb
+
 
 class DuckDBConnector:
     """Unified connector for DuckDB database.
@@ -46,40 +76,49 @@ class DuckDBConnector:
         Raises:
             ImportError: If required dependencies are not installed (install with: pip install dataloader[duckdb])
         """
-        if duckdb is None:
+        if _import_duckdb() is None:
             raise ImportError(
                 "DuckDBConnector requires duckdb. "
                 "Install it with: pip install dataloader[duckdb]"
             )
         self._config = config
 
-        # Extract config values
-        if isinstance(config, DuckDBConnectorConfig):
-            self._database = config.database
-            self._table = config.table
-            self._schema = config.db_schema
-            self._write_mode = config.write_mode
-            self._merge_keys = config.merge_keys
-        elif isinstance(config, SourceConfig):
-            self._database = config.database or ":memory:"
-            self._table = config.table or ""
-            self._schema = config.db_schema
-            self._write_mode = "append"  # Default for source configs
-            self._merge_keys = None
-        else:  # DestinationConfig
-            self._database = config.database or ":memory:"
-            self._table = config.table or ""
-            self._schema = config.db_schema
-            self._write_mode = config.write_mode
-            self._merge_keys = config.merge_keys
+        # Extract config values (all three config types share these field names;
+        # source configs have no write settings and read as append)
+        self._database = config.database or ":memory:"
+        self._table = config.table or ""
+        self._schema = config.db_schema
+        self._write_mode = getattr(config, "write_mode", "append")
+        self._merge_keys = getattr(config, "merge_keys", None)
+
+        # Database settings passed to duckdb.connect(); unset values keep DuckDB defaults
+        self._settings: dict[str, Any] = {}
+        for setting in ("threads", "memory_limit", "temp_directory"):
+            value = getattr(config, setting, None)
+            if value is not None:
+                self._settings[setting] = value
+        self._preserve_insertion_order = getattr(
+            config, "preserve_insertion_order", False
+        )
+        self._write_settings_applied = False
+        self._write_lock = threading.Lock()
 
         self._batch_size = DEFAULT_BATCH_SIZE
         self._conn: DuckDBPyConnection | None = None
         self._table_created = False
         self._type_mapper = DuckDBTypeMapper()
 
-    @property
-    def _qualified_table(self) -> str:
+        # Per-run caches: the table name never changes, and the column set only
+        # changes through this connector's own DDL, so both are tracked locally
+        # instead of being recomputed/re-queried on every batch.
+        self._qualified_table = self._build_qualified_table()
+        self._known_columns: set[str] | None = None
+        # Column tuple of the last batch reconciled against the table; a batch
+        # with the same columns needs no schema evolution work at all.
+        self._last_columns: tuple[str, ...] | None = None
+        self._insert_sql_cache: dict[tuple[str, ...], str] = {}
+
+    def _build_qualified_table(self) -> str:
         """Return fully qualified table name."""
         if self._schema:
             return f'"{self._schema}"."{self._table}"'
@@ -89,7 +128,7 @@ class DuckDBConnector:
         """Get or create DuckDB connection."""
         if self._conn is None:
             try:
-                self._conn = duckdb.connect(self._database)
+                self._conn = duckdb.connect(self._database, config=self._settings)
             except duckdb.Error as e:
                 raise ConnectorError(
                     f"Failed to connect to DuckDB: {e}",
@@ -109,27 +148,23 @@ class DuckDBConnector:
 
     # ========== Reading methods ==========
 
-    def _get_schema(self) -> list[tuple[str, pa.DataType]]:
-        """Fetch column names and Arrow types from DuckDB table.
+    def _fetch_table_columns(self, conn: DuckDBPyConnection) -> list[tuple[str, str]]:
+        """Fetch (column_name, duckdb_type) pairs for the table from the catalog.
 
-        Returns:
-            List of (column_name, arrow_type) tuples.
+        Queries the ``duckdb_columns()`` system function directly instead of
+        planning a ``DESCRIBE`` statement. Names are compared case-insensitively,
+        the way DuckDB resolves identifiers. Returns an empty list if the table
+        does not exist.
         """
-        conn = self._get_connection()
-        try:
-            result = conn.execute(f"DESCRIBE {self._qualified_table}")
-            schema_info = []
-            for row in result.fetchall():
-                col_name = row[0]
-                duckdb_type_str = row[1]
-                arrow_type = self._type_mapper.connector_type_to_arrow(duckdb_type_str)
-                schema_info.append((col_name, arrow_type))
-            return schema_info
-        except duckdb.CatalogException as e:
-            raise ConnectorError(
-                f"Table does not exist: {e}",
-                context={"table": self._table, "schema": self._schema},
-            ) from e
+        result = conn.execute(
+            "SELECT column_name, data_type FROM duckdb_columns() "
+            "WHERE database_name = current_database() "
+            "AND lower(schema_name) = lower(COALESCE(?, current_schema())) "
+            "AND lower(table_name) = lower(?) "
+            "ORDER BY column_index",
+            [self._schema, self._table],
+        )
+        return result.fetchall()
 
     def _build_query(self, state: State) -> tuple[str, list[Any]]:
         """Build SELECT query with optional cursor-based filtering.
@@ -175,45 +210,47 @@ class DuckDBConnector:
         """
         try:
             conn = self._get_connection()
-            schema_info = self._get_schema()
-            columns = [col[0] for col in schema_info]
-            # Convert Arrow types to string for metadata
-            column_types = {col[0]: str(col[1]) for col in schema_info}
-
             query, params = self._build_query(state)
 
-            # Use DuckDB's native Arrow support
-            if params:
-                result = conn.execute(query, params)
+            try:
+                if params:
+                    result = conn.execute(query, params)
+                else:
+                    result = conn.execute(query)
+            except duckdb.CatalogException as e:
+                raise ConnectorError(
+                    f"Table does not exist: {e}",
+                    context={"table": self._table, "schema": self._schema},
+                ) from e
+
+            # Stream Arrow record batches straight from DuckDB's columnar result
+            # (fetch_record_batch was renamed to_arrow_reader in newer releases)
+            if hasattr(result, "to_arrow_reader"):
+                reader = result.to_arrow_reader(self._batch_size)
             else:
-                result = conn.execute(query)
+                reader = result.fetch_record_batch(self._batch_size)
 
-            batch_number = 0
-            while True:
-                # Fetch batch using fetchmany, then convert to Arrow
-                # (DuckDB's fetch_arrow_table fetches all remaining rows, so we use fetchmany)
-                rows = result.fetchmany(self._batch_size)
-                if not rows:
-                    break
+            # Column types come straight from the result's Arrow schema, so no
+            # separate catalog lookup or DuckDB -> Arrow type mapping is needed
+            column_types = {field.name: str(field.type) for field in reader.schema}
 
-                # Convert rows to list format
-                row_data = [list(row) for row in rows]
+            batch_number = 0
+            for record_batch in reader:
+                if record_batch.num_rows == 0:
+                    continue
 
-                # Create ArrowBatch from rows
                 batch_number += 1
-                batch = ArrowBatch.from_rows(
-                    columns=columns,
-                    rows=row_data,
+                yield ArrowBatch(
+                    pa.Table.from_batches([record_batch]),
                     metadata={
                         "batch_number": batch_number,
-                        "row_count": len(row_data),
+                        "row_count": record_batch.num_rows,
                         "source_type": "duckdb",
                         "table": self._table,
                         "schema": self._schema,
                         "column_types": column_types,
                     },
                 )
-                yield batch
 
         except ConnectorError:
             raise
@@ -229,32 +266,35 @@ class DuckDBConnector:
 
     # ========== Writing methods ==========
 
-    def _map_arrow_type_to_duckdb(self, arrow_type: pa.DataType) -> str:
-        """Map Arrow type to DuckDB type (delegates to TypeMapper)."""
-        return self._type_mapper.arrow_to_connector_type(arrow_type)
+    def _resolve_column_types(
+        self, batch: ArrowBatch, skip: set[str] | None = None
+    ) -> list[tuple[str, str]]:
+        """Resolve (column_name, duckdb_type) pairs in one pass over the batch schema.
+
+        Args:
+            batch: Batch whose Arrow schema defines the columns.
+            skip: Column names to leave out (e.g., columns the table already has).
+
+        Returns:
+            List of (column_name, duckdb_type) tuples in batch column order.
+        """
+        map_type = self._type_mapper.arrow_to_connector_type
+        return [
+            (field.name, map_type(field.type))
+            for field in batch.to_arrow().schema
+            if skip is None or field.name not in skip
+        ]
 
     def _get_existing_columns(self, conn: DuckDBPyConnection) -> set[str]:
-        """Get existing columns for the table."""
-        try:
-            result = conn.execute(f"DESCRIBE {self._qualified_table}")
-            return {row[0] for row in result.fetchall()}
-        except duckdb.CatalogException:
-            return set()
+        """Get existing columns for the table (empty if it does not exist)."""
+        return {col_name for col_name, _ in self._fetch_table_columns(conn)}
 
     def _create_table(self, conn: DuckDBPyConnection, batch: ArrowBatch) -> None:
         """Create table from batch schema if it doesn't exist."""
-        # Get Arrow schema to determine column types
-        arrow_table = batch.to_arrow()
-        arrow_schema = arrow_table.schema
-
-        # Build column definitions from Arrow schema
-        column_defs = []
-        for col_name in batch.columns:
-            arrow_field = arrow_schema.field(col_name)
-            duckdb_type = self._map_arrow_type_to_duckdb(arrow_field.type)
-            column_defs.append(f'"{col_name}" {duckdb_type}')
-
-        columns_sql = ", ".join(column_defs)
+        columns_sql = ", ".join(
+            f'"{col_name}" {duckdb_type}'
+            for col_name, duckdb_type in self._resolve_column_types(batch)
+        )
 
         try:
             conn.execute(
@@ -265,27 +305,49 @@ class DuckDBConnector:
                 f"Failed to create table: {e}",
                 context={"table": self._table, "columns": batch.columns},
             ) from e
+        self._known_columns = set(batch.columns)
+        self._last_columns = tuple(batch.columns)
 
-    def _add_missing_columns(self, conn: DuckDBPyConnection, batch: ArrowBatch) -> None:
-        """Add columns that exist in batch but not in table (schema evolution)."""
-        existing = self._get_existing_columns(conn)
-        arrow_table = batch.to_arrow()
-        arrow_schema = arrow_table.schema
+    def _add_missing_columns(
+        self, conn: DuckDBPyConnection, batch: ArrowBatch, existing: set[str]
+    ) -> None:
+        """Add columns that exist in batch but not in table (schema evolution).
 
-        for col_name in batch.columns:
-            if col_name not in existing:
-                arrow_field = arrow_schema.field(col_name)
-                duckdb_type = self._map_arrow_type_to_duckdb(arrow_field.type)
+        ``existing`` is updated in place as columns are added. All new columns
+        are resolved in a single pass over the batch schema and added with one
+        ``execute`` call (DuckDB accepts only one ALTER command per statement,
+        so the statements are sent together as a script).
 
-                try:
-                    conn.execute(
-                        f'ALTER TABLE {self._qualified_table} ADD COLUMN "{col_name}" {duckdb_type}'
-                    )
-                except duckdb.Error as e:
-                    raise ConnectorError(
-                        f"Failed to add column '{col_name}': {e}",
-                        context={"table": self._table, "column": col_name},
-                    ) from e
+        Steady-state batches repeat the previous batch's columns, so that case
+        returns before touching the schema at all.
+        """
+        columns = tuple(batch.columns)
+        if columns == self._last_columns:
+            return
+
+        missing = self._resolve_column_types(batch, skip=existing)
+        if not missing:
+            self._last_columns = columns
+            return
+
+        alter_sql = "; ".join(
+            f'ALTER TABLE {self._qualified_table} ADD COLUMN "{col_name}" {duckdb_type}'
+            for col_name, duckdb_type in missing
+        )
+        missing_names = [col_name for col_name, _ in missing]
+        try:
+            conn.execute(alter_sql)
+        except duckdb.Error as e:
+            # Some columns may have been added before the failure; re-read the
+            # catalog on the next batch instead of trusting the cache.
+            self._known_columns = None
+            self._last_columns = None
+            raise ConnectorError(
+                f"Failed to add columns {missing_names}: {e}",
+                context={"table": self._table, "columns": missing_names},
+            ) from e
+        existing.update(missing_names)
+        self._last_columns = columns
 
     def _handle_write_mode(
         self, conn: DuckDBPyConnection, batch: ArrowBatch, full_refresh: bool = False
@@ -297,23 +359,40 @@ class DuckDBConnector:
             batch: Batch to write
             full_refresh: If True, use destructive DROP operations. If False, use DELETE/TRUNCATE for overwrite.
         """
-        if self._write_mode == "overwrite" and not self._table_created:
-            if full_refresh:
-                # Full refresh: drop and recreate table (destructive)
-                try:
-                    conn.execute(f"DROP TABLE IF EXISTS {self._qualified_table}")
-                except duckdb.Error as e:
-                    raise ConnectorError(
-                        f"Failed to drop table for full refresh: {e}",
-                        context={"table": self._table},
-                    ) from e
-                # Always create after drop in full_refresh mode
+        if self._write_mode == "merge":
+            # Merge not supported in v0.1
+            raise ConnectorError(
+                "Merge write mode is not supported in v0.1. Use 'append' or 'overwrite'.",
+                context={"table": self._table, "write_mode": self._write_mode},
+            )
+
+        if self._table_created:
+            # The table was prepared by the first batch of this run; later batches
+            # only need new columns reconciled against the cached column set.
+            if self._known_columns is None:
+                self._known_columns = self._get_existing_columns(conn)
+            self._add_missing_columns(conn, batch, self._known_columns)
+            return
+
+        if full_refresh:
+            # Full refresh (overwrite or append): drop and recreate table (destructive)
+            try:
+                conn.execute(f"DROP TABLE IF EXISTS {self._qualified_table}")
+            except duckdb.Error as e:
+                raise ConnectorError(
+                    f"Failed to drop table for full refresh: {e}",
+                    context={"table": self._table},
+                ) from e
+            self._known_columns = None
+            self._last_columns = None
+            self._create_table(conn, batch)
+        else:
+            self._known_columns = self._get_existing_columns(conn)
+            if not self._known_columns:
                 self._create_table(conn, batch)
-                self._table_created = True
             else:
-                # Default overwrite: delete all rows (preserves structure)
-                existing = self._get_existing_columns(conn)
-                if existing:
+                if self._write_mode == "overwrite":
+                    # Default overwrite: delete all rows (preserves structure)
                     try:
                         conn.execute(f"DELETE FROM {self._qualified_table}")
                     except duckdb.Error as e:
@@ -321,54 +400,56 @@ class DuckDBConnector:
                             f"Failed to delete from table for overwrite: {e}",
                             context={"table": self._table},
                         ) from e
-                # Create table if it doesn't exist
-                if not existing:
-                    self._create_table(conn, batch)
-                self._table_created = True
-
-        elif self._write_mode == "merge":
-            # Merge not supported in v0.1
-            raise ConnectorError(
-                "Merge write mode is not supported in v0.1. Use 'append' or 'overwrite'.",
-                context={"table": self._table, "write_mode": self._write_mode},
-            )
+                # Handle schema evolution against the existing table
+                self._add_missing_columns(conn, batch, self._known_columns)
+        self._table_created = True
 
-        elif self._write_mode == "append":
-            if full_refresh and not self._table_created:
-                # Full refresh with append: drop and recreate (destructive)
-                try:
-                    conn.execute(f"DROP TABLE IF EXISTS {self._qualified_table}")
-                except duckdb.Error as e:
-                    raise ConnectorError(
-                        f"Failed to drop table for full refresh: {e}",
-                        context={"table": self._table},
-                    ) from e
-                self._create_table(conn, batch)
-            else:
-                # Default append: ensure table exists and handle schema evolution
-                existing = self._get_existing_columns(conn)
-                if not existing:
-                    self._create_table(conn, batch)
-                else:
-                    self._add_missing_columns(conn, batch)
-            self._table_created = True
+    def _get_insert_sql(self, columns: list[str]) -> str:
+        """Return the INSERT ... SELECT statement for a column layout, building it once.
 
-    def _insert_batch(self, conn: DuckDBPyConnection, batch: ArrowBatch) -> None:
-        """Insert batch rows using DuckDB's native Arrow support."""
+        The statement reads from the staging view registered by _insert_batch and
+        matches columns by name, so batches may carry a subset of the table columns.
+        """
+        key = tuple(columns)
+        insert_sql = self._insert_sql_cache.get(key)
+        if insert_sql is None:
+            column_list = _quote_columns(key)
+            insert_sql = (
+                f"INSERT INTO {self._qualified_table} ({column_list}) "
+                f"SELECT {column_list} FROM {STAGING_VIEW}"
+            )
+            self._insert_sql_cache[key] = insert_sql
+        return insert_sql
+
+    def _get_row_insert_sql(self, columns: list[str]) -> str:
+        """Return the parameterized INSERT statement used for non-Arrow batches."""
+        column_list = _quote_columns(tuple(columns))
+        placeholders = _placeholders(len(columns))
+        return f"INSERT INTO {self._qualified_table} ({column_list}) VALUES ({placeholders})"
+
+    def _insert_batch(self, conn: DuckDBPyConnection, batch: Batch) -> None:
+        """Insert batch rows using DuckDB's native Arrow scan.
+
+        Batches that expose an Arrow view (``to_arrow()``, as ArrowBatch and
+        Arrow-backed format readers do) are registered as a view and inserted
+        with a single INSERT ... SELECT, so DuckDB binds column types once and
+        scans the Arrow buffers directly instead of binding parameters row by
+        row. Batches without an Arrow view fall back to a parameterized
+        executemany.
+        """
         if batch.row_count == 0:
             return
 
+        to_arrow = getattr(batch, "to_arrow", None)
         try:
-            # Convert Arrow table to rows and use executemany
-            # (DuckDB's native Arrow insertion can be added as optimization later)
-            arrow_table = batch.to_arrow()
-            rows = batch.rows  # This converts Arrow to list of lists
-
-            columns = ", ".join(f'"{col}"' for col in batch.columns)
-            placeholders = ", ".join("?" for _ in batch.columns)
-            insert_sql = f"INSERT INTO {self._qualified_table} ({columns}) VALUES ({placeholders})"
-
-            conn.executemany(insert_sql, rows)
+            if to_arrow is not None:
+                conn.register(STAGING_VIEW, to_arrow())
+                try:
+                    conn.execute(self._get_insert_sql(batch.columns))
+                finally:
+                    conn.unregister(STAGING_VIEW)
+            else:
+                conn.executemany(self._get_row_insert_sql(batch.columns), batch.rows)
         except duckdb.Error as e:
             raise ConnectorError(
                 f"Failed to insert batch: {e}",
@@ -383,7 +464,10 @@ class DuckDBConnector:
         """Write a batch to DuckDB table.
 
         Creates the table if it doesn't exist, handles schema evolution
-        for new columns, and inserts rows using parameterized queries.
+        for new columns, and inserts rows. The DDL and the insert for a batch
+        run in a single transaction, so they commit together (one WAL flush)
+        and a failed batch leaves the table untouched. Concurrent calls are
+        serialized on the connector's connection.
 
         Args:
             batch: Batch of data to write.
@@ -398,10 +482,39 @@ class DuckDBConnector:
         # DuckDB supports full_refresh (DROP TABLE operations)
         # If full_refresh were not supported, raise ConnectorError here with a clear message
 
-        conn = self._get_connection()
+        with self._write_lock:
+            conn = self._get_connection()
+
+            if not self._write_settings_applied:
+                # Bulk loads don't need DuckDB to keep rows in insertion order, which
+                # lets it parallelize inserts. Opt back in via preserve_insertion_order.
+                if not self._preserve_insertion_order:
+                    conn.execute("SET SESSION preserve_insertion_order = false")
+                self._write_settings_applied = True
 
-        self._handle_write_mode(conn, batch, full_refresh=full_refresh)
-        self._insert_batch(conn, batch)
+            table_created = self._table_created
+            try:
+                conn.begin()
+                self._handle_write_mode(conn, batch, full_refresh=full_refresh)
+                self._insert_batch(conn, batch)
+                conn.commit()
+            except BaseException as e:
+                # Roll back on any failure (including non-DuckDB errors and
+                # interrupts) so the next batch doesn't start inside this one
+                try:
+                    conn.rollback()
+                except duckdb.Error:
+                    pass  # Transaction was never started or is already aborted
+                # DDL from this batch was rolled back too, so drop cached table state
+                self._table_created = table_created
+                self._known_columns = None
+                self._last_columns = None
+                if not isinstance(e, duckdb.Error):
+                    raise
+                raise ConnectorError(
+                    f"Failed to write batch: {e}",
+                    context={"table": self._table, "row_count": batch.row_count},
+                ) from e
 
 
 @register_connector("duckdb")
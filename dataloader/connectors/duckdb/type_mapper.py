@@ -4,6 +4,53 @@ import pyarrow as pa
 
 from dataloader.core.type_mapping import TypeMapper
 
+# Arrow type id -> DuckDB type. Keyed on the type id so parameterized types
+# (e.g. every timestamp unit/timezone) resolve with a single dict lookup.
+_ARROW_TO_DUCKDB: dict[int, str] = {
+    pa.string().id: "VARCHAR",
+    pa.large_string().id: "VARCHAR",
+    pa.int8().id: "INTEGER",
+    pa.int16().id: "INTEGER",
+    pa.int32().id: "INTEGER",
+    pa.int64().id: "BIGINT",
+    pa.uint8().id: "INTEGER",
+    pa.uint16().id: "INTEGER",
+    pa.uint32().id: "INTEGER",
+    pa.uint64().id: "INTEGER",
+    pa.float16().id: "FLOAT",
+    pa.float32().id: "FLOAT",
+    pa.float64().id: "DOUBLE",
+    pa.bool_().id: "BOOLEAN",
+    pa.timestamp("us").id: "TIMESTAMP",
+    pa.date32().id: "DATE",
+    pa.date64().id: "DATE",
+}
+
+# DuckDB type (upper-cased) -> Arrow type, including the common aliases.
+_DUCKDB_TO_ARROW: dict[str, pa.DataType] = {
+    "VARCHAR": pa.string(),
+    "TEXT": pa.string(),
+    "CHAR": pa.string(),
+    "BIGINT": pa.int64(),
+    "INT8": pa.int64(),
+    "INTEGER": pa.int32(),
+    "INT": pa.int32(),
+    "INT4": pa.int32(),
+    "SMALLINT": pa.int16(),
+    "INT2": pa.int16(),
+    "DOUBLE": pa.float64(),
+    "FLOAT8": pa.float64(),
+    "FLOAT": pa.float32(),
+    "FLOAT4": pa.float32(),
+    "REAL": pa.float32(),
+    "BOOLEAN": pa.bool_(),
+    "TIMESTAMP": pa.timestamp("us"),
+    "DATE": pa.date32(),
+}
+
+# Unknown DuckDB types are read as strings
+_DEFAULT_ARROW_TYPE = pa.string()
+
 
 class DuckDBTypeMapper:
     """Type mapper for DuckDB connector.
@@ -19,31 +66,10 @@ class DuckDBTypeMapper:
             arrow_type: PyArrow DataType
 
         Returns:
-            DuckDB type string (e.g., "VARCHAR", "BIGINT", "TIMESTAMP")
+            DuckDB type string (e.g., "VARCHAR", "BIGINT", "TIMESTAMP").
+            Unknown types default to VARCHAR.
         """
-        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
-            return "VARCHAR"
-        elif pa.types.is_integer(arrow_type):
-            if pa.types.is_int64(arrow_type):
-                return "BIGINT"
-            elif pa.types.is_int32(arrow_type):
-                return "INTEGER"
-            else:
-                return "INTEGER"
-        elif pa.types.is_floating(arrow_type):
-            if pa.types.is_float64(arrow_type):
-                return "DOUBLE"
-            else:
-                return "FLOAT"
-        elif pa.types.is_boolean(arrow_type):
-            return "BOOLEAN"
-        elif pa.types.is_timestamp(arrow_type):
-            return "TIMESTAMP"
-        elif pa.types.is_date(arrow_type) or pa.types.is_date32(arrow_type):
-            return "DATE"
-        else:
-            # Default to VARCHAR for unknown types
-            return "VARCHAR"
+        return _ARROW_TO_DUCKDB.get(arrow_type.id, "VARCHAR")
 
     def connector_type_to_arrow(self, connector_type: str) -> pa.DataType:
         """Map DuckDB type to Arrow type.
@@ -54,27 +80,4 @@ class DuckDBTypeMapper:
         Returns:
             PyArrow DataType
         """
-        duckdb_type_upper = connector_type.upper()
-
-        # Handle common DuckDB types
-        if duckdb_type_upper in ("VARCHAR", "TEXT", "CHAR"):
-            return pa.string()
-        elif duckdb_type_upper in ("BIGINT", "INT8"):
-            return pa.int64()
-        elif duckdb_type_upper in ("INTEGER", "INT", "INT4"):
-            return pa.int32()
-        elif duckdb_type_upper in ("SMALLINT", "INT2"):
-            return pa.int16()
-        elif duckdb_type_upper in ("DOUBLE", "FLOAT8"):
-            return pa.float64()
-        elif duckdb_type_upper in ("FLOAT", "FLOAT4", "REAL"):
-            return pa.float32()
-        elif duckdb_type_upper == "BOOLEAN":
-            return pa.bool_()
-        elif duckdb_type_upper == "TIMESTAMP":
-            return pa.timestamp("us")
-        elif duckdb_type_upper == "DATE":
-            return pa.date32()
-        else:
-            # Default to string for unknown types
-            return pa.string()
+        return _DUCKDB_TO_ARROW.get(connector_type.upper(), _DEFAULT_ARROW_TYPE)
@@ -5,9 +5,9 @@ which supports multiple storage backends (S3, local filesystem, Azure, GCS, etc.
 using fsspec for abstraction.
 """
 
-from typing import Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, SecretStr, model_validator
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
 
 from dataloader.models.source_config import IncrementalConfig
 
@@ -19,6 +19,9 @@ class FileStoreConnectorConfig(BaseModel):
     Use specific config classes like S3FileStoreConfig or LocalFileStoreConfig.
     """
 
+    # Build validators on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["filestore"] = "filestore"
     path: str = Field(
         description="File path or prefix (supports templates and URL formats)"
@@ -28,6 +31,28 @@ class FileStoreConnectorConfig(BaseModel):
     incremental: Optional[IncrementalConfig] = Field(
         default=None, description="Incremental loading configuration (for reads)"
     )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Local directory for caching remote files between reads (for reads)",
+    )
+    cache_expiry: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to trust cached files without re-checking the remote copy (for reads)",
+    )
+    prefetch_files: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Files to read ahead of the one being parsed (remote by default, local when set); 0 disables (for reads)",
+    )
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Columns to read from Parquet files (for reads)",
+    )
+    filters: Optional[List[List[Any]]] = Field(
+        default=None,
+        description='Parquet row filters in pyarrow DNF form, e.g. [["id", ">", 10]] (for reads)',
+    )
 
     # Destination-specific fields (for writing)
     write_mode: Literal["append", "overwrite"] = Field(
@@ -38,6 +63,10 @@ class FileStoreConnectorConfig(BaseModel):
     format: Literal["csv", "json", "jsonl", "parquet"] = Field(
         default="csv", description="File format to read/write"
     )
+    compression: Optional[Literal["gzip"]] = Field(
+        default=None,
+        description="Gzip-compress written files and read .gz files (csv, json, jsonl)",
+    )
 
 
 class S3FileStoreConfig(FileStoreConnectorConfig):
@@ -80,5 +109,8 @@ class LocalFileStoreConfig(FileStoreConnectorConfig):
         return self
 
 
-# Union type for all FileStore configs
-FileStoreConfigType = Union[S3FileStoreConfig, LocalFileStoreConfig]
+# Union type for all FileStore configs, tagged on 'backend' so validation
+# dispatches straight to the matching model instead of trying each in turn
+FileStoreConfigType = Annotated[
+    Union[S3FileStoreConfig, LocalFileStoreConfig], Field(discriminator="backend")
+]
@@ -3,13 +3,17 @@
 Uses fsspec for abstraction, supporting S3, local filesystem, Azure, GCS, and other backends.
 """
 
+from __future__ import annotations
+
+import gzip
 import os
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from io import BufferedReader, BytesIO, RawIOBase
 from pathlib import Path
-from typing import Any, Iterable, Union
-
-import fsspec
-from fsspec import AbstractFileSystem
+from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from dataloader.connectors.registry import ConnectorConfigUnion, register_connector
 from dataloader.core.batch import ArrowBatch, Batch
@@ -21,9 +25,130 @@ from dataloader.models.source_config import SourceConfig
 from .config import FileStoreConfigType, LocalFileStoreConfig, S3FileStoreConfig
 from .formats import Format, get_format
 
+# fsspec is imported when the first filesystem is created, so importing
+# dataloader does not pay for it (and its entry-point scan) unless files are used
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
 DEFAULT_BATCH_SIZE = 1000
 DEFAULT_ENCODING = "utf-8"
 
+# Format-specific options (for CSV, using defaults)
+DEFAULT_FORMAT_OPTIONS = {
+    "delimiter": ",",
+    "has_header": True,
+}
+
+# Extensions that mark a local path as a file rather than a directory
+FILE_EXTENSIONS = (".csv", ".json", ".jsonl", ".parquet", ".gz")
+
+# Suffix added to compressed file names, and the gzip level used for writes:
+# level 1 gets most of the size reduction at a fraction of the default's CPU cost
+GZIP_EXTENSION = ".gz"
+GZIP_COMPRESSLEVEL = 1
+
+# URL scheme -> storage backend
+URL_SCHEME_BACKENDS = {
+    "s3": "s3",
+    "gs": "gcs",
+    "az": "azure",
+    "abfss": "azure",
+    "file": "local",
+}
+URL_SCHEMES = tuple(f"{scheme}://" for scheme in URL_SCHEME_BACKENDS)
+
+# Remote reads are forward scans over whole files, so fetch large blocks and read
+# ahead; each GET then covers more data and overlaps with parsing. S3 takes these
+# as filesystem defaults; the block size is also passed to each remote fs.open so
+# other backends (GCS, Azure) use it too.
+REMOTE_BLOCK_SIZE = 32 * 2**20
+REMOTE_CACHE_TYPE = "readahead"
+
+# S3 uploads of at least two parts go out as multipart uploads whose parts s3fs
+# sends concurrently (up to its max_concurrency, 10 by default)
+S3_UPLOAD_PART_SIZE = 16 * 2**20
+
+# Connections in the shared S3 client's pool (botocore defaults to 10), enough
+# for prefetches, range reads and multipart parts to run at the same time
+S3_MAX_POOL_CONNECTIONS = 64
+
+# Remote files up to PREFETCH_MAX_FILE_SIZE bytes are downloaded in the background,
+# up to PREFETCH_FILES ahead of the file being parsed, so per-object request
+# latency overlaps with parsing. Larger files are streamed as they are parsed.
+# PREFETCH_FILES is the default for the prefetch_files option.
+PREFETCH_FILES = 4
+PREFETCH_MAX_FILE_SIZE = 8 * 2**20
+
+# Remote files too large to prefetch are downloaded as byte ranges of up to
+# RANGE_CHUNK_SIZE, RANGE_WORKERS at a time, when the format reads them front to
+# back. Later ranges download while earlier ones are parsed, and the parallel
+# requests lift the rate cap of a single connection. Files are split into at
+# least RANGE_WORKERS ranges so the overlap also applies to mid-sized files.
+RANGE_MIN_FILE_SIZE = PREFETCH_MAX_FILE_SIZE
+RANGE_CHUNK_SIZE = 16 * 2**20
+RANGE_WORKERS = 4
+
+
+class _RangeReader(RawIOBase):
+    """Forward-only file object that downloads a remote file as parallel ranges.
+
+    Keeps up to ``window`` ranges in flight on the pool and hands their bytes out
+    in order, so memory use is bounded by ``window * chunk_size``.
+    """
+
+    def __init__(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        size: int,
+        pool: ThreadPoolExecutor,
+        chunk_size: int,
+        window: int,
+    ):
+        super().__init__()
+        self._fs = fs
+        self._path = path
+        self._size = size
+        self._pool = pool
+        self._chunk_size = chunk_size
+        self._window = window
+        self._next_start = 0
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _submit_ranges(self) -> None:
+        """Top up the in-flight ranges to the window size."""
+        while len(self._pending) < self._window and self._next_start < self._size:
+            end = min(self._next_start + self._chunk_size, self._size)
+            self._pending.append(
+                self._pool.submit(
+                    self._fs.cat_file, self._path, start=self._next_start, end=end
+                )
+            )
+            self._next_start = end
+
+    def readinto(self, b: Any) -> int:
+        if not self._buffer:
+            self._submit_ranges()
+            if not self._pending:
+                return 0
+            self._buffer = memoryview(self._pending.popleft().result())
+            self._submit_ranges()
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._buffer = memoryview(b"")
+        super().close()
+
 
 class FileStoreConnector:
     """Unified connector for file-based storage backends using fsspec.
@@ -76,23 +201,92 @@ class FileStoreConnector:
         self._batch_size = DEFAULT_BATCH_SIZE
         self._encoding = DEFAULT_ENCODING
 
-        # Format-specific options (for CSV, using defaults)
-        format_options = {
-            "delimiter": ",",
-            "has_header": True,
+        # Initialize format handler (shared between connectors for built-in formats)
+        self._format_handler = get_format(self._format, **DEFAULT_FORMAT_OPTIONS)
+
+        # Gzip compression for written files; compressed files are also listed
+        # and decompressed on read
+        self._compression: str | None = getattr(config, "compression", None)
+        if self._compression and self._format == "parquet":
+            raise ConnectorError(
+                "Compression is not supported for Parquet files, which are "
+                "compressed internally. Use it with csv, json or jsonl.",
+                context={"format": self._format, "compression": self._compression},
+            )
+
+        # Column projection and row filters handed to the Parquet reader
+        self._read_options: dict[str, Any] = {
+            name: value
+            for name in ("columns", "filters")
+            if (value := getattr(config, name, None)) is not None
         }
+        if self._read_options and self._format != "parquet":
+            raise ConnectorError(
+                "columns and filters are only supported for Parquet files.",
+                context={"format": self._format, "options": list(self._read_options)},
+            )
 
-        # Initialize format handler
-        self._format_handler = get_format(self._format, **format_options)
+        # Lowercased once so listings can match with a single str.endswith call
+        self._lowered_extensions = tuple(
+            ext.lower() for ext in self._format_handler.extensions
+        )
+        if self._compression:
+            self._lowered_extensions += tuple(
+                ext + GZIP_EXTENSION for ext in self._lowered_extensions
+            )
+        # Extension for written files (first one the format handler lists)
+        self._file_extension = (
+            self._format_handler.extensions[0]
+            if self._format_handler.extensions
+            else ".dat"
+        )
+        if self._compression:
+            self._file_extension += GZIP_EXTENSION
 
         # Writing state
         self._file_initialized = False
         self._batch_counter = 0
         self._written_files: list[str] = []
+        # Snapshot handed out by written_files; rebuilt only after new writes
+        self._written_files_view: tuple[str, ...] | None = None
+        # write_batch may be called from several threads (the async engine runs
+        # writes in an executor); the lock covers first-write cleanup, file
+        # naming and bookkeeping, while serialization and uploads run concurrently
+        self._write_lock = threading.Lock()
 
         # Build fsspec storage options
         self._storage_options = self._build_storage_options(config, None)
         self._filesystem: AbstractFileSystem | None = None
+        # URLs already confirmed to be directories (see _is_dir)
+        self._known_dirs: set[str] = set()
+
+        # Optional local cache for remote file reads
+        self._cache_dir: str | None = getattr(config, "cache_dir", None)
+        self._cache_expiry: int | None = getattr(config, "cache_expiry", None)
+        self._read_filesystem: AbstractFileSystem | None = None
+
+        # Remote files are opened with large blocks so each request covers more data
+        self._open_options: dict[str, Any] = (
+            {} if self._backend == "local" else {"block_size": REMOTE_BLOCK_SIZE}
+        )
+
+        self._pipe_options: dict[str, Any] = (
+            {"chunksize": S3_UPLOAD_PART_SIZE} if self._backend == "s3" else {}
+        )
+
+        # Read-ahead window for remote files (see PREFETCH_FILES). Local files are
+        # only read ahead when prefetch_files is set explicitly, which keeps
+        # several reads in flight for directories of many small files
+        prefetch_files = getattr(config, "prefetch_files", None)
+        self._prefetch_files: int = (
+            PREFETCH_FILES if prefetch_files is None else prefetch_files
+        )
+        self._prefetch_local: bool = bool(prefetch_files)
+
+        # URLs derived from the configured path; computed on first use
+        self._list_url: tuple[str, bool] | None = None
+        self._base_path_url: str | None = None
+        self._write_url_prefix: str | None = None
 
     def _infer_backend_from_config(
         self, config: Union[SourceConfig, DestinationConfig]
@@ -108,14 +302,9 @@ class FileStoreConnector:
             return "local"
 
         # Check for URL schemes
-        if filepath.startswith("s3://"):
-            return "s3"
-        elif filepath.startswith("gs://"):
-            return "gcs"
-        elif filepath.startswith("az://") or filepath.startswith("abfss://"):
-            return "azure"
-        elif filepath.startswith("file://"):
-            return "local"
+        scheme, separator, _ = filepath.partition("://")
+        if separator:
+            return URL_SCHEME_BACKENDS.get(scheme, "local")
 
         return "local"  # Default to local
 
@@ -159,6 +348,12 @@ class FileStoreConnector:
             if region:
                 storage_options["client_kwargs"] = {"region_name": region}
 
+            storage_options["default_block_size"] = REMOTE_BLOCK_SIZE
+            storage_options["default_cache_type"] = REMOTE_CACHE_TYPE
+            storage_options["config_kwargs"] = {
+                "max_pool_connections": S3_MAX_POOL_CONNECTIONS
+            }
+
             # Support custom endpoint (LocalStack, MinIO)
             if conn.get("endpoint_url"):
                 if "client_kwargs" not in storage_options:
@@ -177,7 +372,7 @@ class FileStoreConnector:
         If file_path is already a full URL, return it as-is.
         """
         # If file_path is already a full URL, return as-is
-        if file_path.startswith(("s3://", "gs://", "az://", "abfss://", "file://")):
+        if file_path.startswith(URL_SCHEMES):
             return file_path
 
         # For S3FileStoreConfig, construct from bucket + path + file_path
@@ -229,10 +424,7 @@ class FileStoreConnector:
             base_clean = base_path.replace("file://", "")
 
             # Determine if base is directory: ends with /, has glob, or has no file extension
-            valid_extensions = [".csv", ".json", ".jsonl", ".parquet"]
-            has_extension = any(
-                base_clean.lower().endswith(ext) for ext in valid_extensions
-            )
+            has_extension = base_clean.lower().endswith(FILE_EXTENSIONS)
             is_directory = (
                 base_path.endswith("/") or "*" in base_path or not has_extension
             )
@@ -268,10 +460,16 @@ class FileStoreConnector:
             return file_path
 
     def _get_filesystem(self) -> AbstractFileSystem:
-        """Get or create fsspec filesystem instance."""
+        """Get or create fsspec filesystem instance.
+
+        fsspec caches instances by protocol and storage options, so connectors
+        with the same options share one client and its connection pool.
+        """
         if self._filesystem is None:
             try:
                 protocol = self._backend if self._backend != "local" else "file"
+                import fsspec
+
                 self._filesystem = fsspec.filesystem(protocol, **self._storage_options)
             except Exception as e:
                 raise ConnectorError(
@@ -280,24 +478,92 @@ class FileStoreConnector:
                 ) from e
         return self._filesystem
 
+    def _get_read_filesystem(self) -> AbstractFileSystem:
+        """Get the filesystem used to open files for reading.
+
+        When cache_dir is set for a remote backend, the backend filesystem is
+        wrapped in fsspec's whole-file cache so files re-read by later runs come
+        from local disk. By default each open still checks the remote file's
+        identity (e.g., its ETag), so files changed since they were cached are
+        downloaded again. With cache_expiry set, cached copies younger than that
+        many seconds are used without the check (one metadata request per file
+        saved). Listing, deletes and writes always use the backend filesystem
+        directly.
+        """
+        if not self._cache_dir or self._backend == "local":
+            return self._get_filesystem()
+        if self._read_filesystem is None:
+            import fsspec
+
+            if self._cache_expiry is None:
+                cache_options: dict[str, Any] = {"check_files": True}
+            else:
+                cache_options = {
+                    "check_files": False,
+                    "expiry_time": self._cache_expiry,
+                }
+            try:
+                self._read_filesystem = fsspec.filesystem(
+                    "filecache",
+                    fs=self._get_filesystem(),
+                    cache_storage=self._cache_dir,
+                    **cache_options,
+                )
+            except Exception as e:
+                raise ConnectorError(
+                    f"Failed to create file cache in '{self._cache_dir}': {e}",
+                    context={"backend": self._backend, "cache_dir": self._cache_dir},
+                ) from e
+        return self._read_filesystem
+
     # ========== Reading methods ==========
 
     def _list_files(self) -> list[dict[str, Any]]:
         """List files in the configured path using fsspec."""
         fs = self._get_filesystem()
+        file_url, is_file = self._get_list_url()
+
+        try:
+            # A path ending in a format extension names a single file; skip the
+            # directory probe (a LIST request on object stores)
+            if not is_file and self._is_dir(fs, file_url):
+                return [
+                    {
+                        "path": file_path,
+                        # fsspec listings always use "/" separators
+                        "name": file_path.rpartition("/")[2],
+                        "modified": self._modified_from_info(info),
+                        "size": info.get("size"),
+                    }
+                    for file_path, info in self._find_format_files(fs, file_url).items()
+                ]
+            else:
+                # Single file
+                return [{"path": file_url, "name": Path(file_url).name}]
+        except Exception as e:
+            raise ConnectorError(
+                f"Failed to list files: {e}",
+                context={"path": file_url, "backend": self._backend},
+            ) from e
+
+    def _get_list_url(self) -> tuple[str, bool]:
+        """Return the URL to list for reads and whether it names a single file.
+
+        Both depend only on the configured path, so they are computed once.
+        """
+        if self._list_url is not None:
+            return self._list_url
+
+        extensions = self._lowered_extensions
 
         # Build the directory URL for listing files
         # For S3FileStoreConfig, construct from bucket + path directly
         if isinstance(self._config, S3FileStoreConfig):
             bucket = self._config.bucket
             path_prefix = self._path.rstrip("/") if self._path else ""
+            # Check if path is a file (has extension) or directory
+            is_file = path_prefix.lower().endswith(extensions)
             if path_prefix:
-                # Check if path is a file (has extension) or directory
-                valid_extensions = self._format_handler.extensions
-                is_file = any(
-                    path_prefix.lower().endswith(ext.lower())
-                    for ext in valid_extensions
-                )
                 if is_file:
                     # Single file - don't add trailing slash
                     file_url = f"s3://{bucket}/{path_prefix}"
@@ -308,29 +574,61 @@ class FileStoreConnector:
                 file_url = f"s3://{bucket}/"
         else:
             file_url = self._build_file_url(self._path)
+            is_file = self._path.lower().endswith(extensions)
 
-        try:
-            # For directories, list all files
-            if fs.isdir(file_url):
-                files = []
-                # Get valid extensions for this format
-                valid_extensions = self._format_handler.extensions
-                for file_path in fs.find(file_url):
-                    # Filter by format extension
-                    if any(
-                        file_path.lower().endswith(ext.lower())
-                        for ext in valid_extensions
-                    ):
-                        files.append({"path": file_path, "name": Path(file_path).name})
-                return files
-            else:
-                # Single file
-                return [{"path": file_url, "name": Path(file_url).name}]
-        except Exception as e:
-            raise ConnectorError(
-                f"Failed to list files: {e}",
-                context={"path": file_url, "backend": self._backend},
-            ) from e
+        self._list_url = (file_url, is_file)
+        return self._list_url
+
+    def _is_dir(self, fs: AbstractFileSystem, url: str) -> bool:
+        """Return whether url is a directory, remembering positive answers.
+
+        Only directories are cached: a path that is not a directory yet becomes
+        one once files are written under it.
+        """
+        if url in self._known_dirs:
+            return True
+        if fs.isdir(url):
+            self._known_dirs.add(url)
+            return True
+        return False
+
+    def _find_format_files(
+        self, fs: AbstractFileSystem, dir_url: str
+    ) -> dict[str, dict[str, Any]]:
+        """Recursively list files under dir_url that match the format's extensions.
+
+        Uses a single recursive listing; object stores can only filter listings by
+        prefix, so matching extensions client-side is as cheap as a glob. Returns
+        the listing details (size, modification time, ...) keyed by path.
+        """
+        extensions = self._lowered_extensions
+        return {
+            file_path: info
+            for file_path, info in fs.find(dir_url, detail=True).items()
+            if file_path.lower().endswith(extensions)
+        }
+
+    @staticmethod
+    def _modified_from_info(info: dict[str, Any]) -> Any:
+        """Return the modification time carried in listing details, if any.
+
+        Mirrors what fs.modified() returns for the common backends, so listed
+        files need no extra metadata request. Returns None when unknown.
+        """
+        if "LastModified" in info:  # s3fs
+            return info["LastModified"]
+        if "last_modified" in info:  # adlfs
+            return info["last_modified"]
+        mtime = info.get("mtime")
+        if isinstance(mtime, (int, float)):  # local
+            return datetime.fromtimestamp(mtime, tz=timezone.utc)
+        updated = info.get("updated")
+        if isinstance(updated, str):  # gcsfs (RFC 3339 string)
+            try:
+                return datetime.fromisoformat(updated.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        return None
 
     def _filter_files_by_state(
         self, files: list[dict[str, Any]], state: State
@@ -350,10 +648,17 @@ class FileStoreConnector:
             # Ensure file_path is a string (not a Path object) for fsspec
             file_path_str = str(file_path)
 
-            # Filter by modification time
+            # Filter by file name (lexicographic order); checked first since it
+            # needs no metadata
+            if last_file_cursor and file_path_str <= str(last_file_cursor):
+                continue
+
+            # Filter by modification time (taken from the listing when available)
             if last_modified_cursor:
                 try:
-                    mod_time = fs.modified(file_path_str)
+                    mod_time = file_info.get("modified")
+                    if mod_time is None:
+                        mod_time = fs.modified(file_path_str)
                     if isinstance(mod_time, datetime):
                         mod_time_str = mod_time.isoformat()
                     else:
@@ -365,10 +670,6 @@ class FileStoreConnector:
                     # If we can't get mod time, include the file
                     pass
 
-            # Filter by file name (lexicographic order)
-            if last_file_cursor and file_path_str <= str(last_file_cursor):
-                continue
-
             filtered.append(file_info)
 
         return filtered
@@ -398,40 +699,86 @@ class FileStoreConnector:
             files.sort(key=lambda x: x["path"])
 
             # Read each file using format handler
-            fs = self._get_filesystem()
-            for file_info in files:
-                file_path = file_info["path"]
-                # Ensure file_path is a string (not a Path object) for fsspec
-                file_path_str = str(file_path)
-
-                try:
-                    # Read file using fsspec
-                    # For binary formats (parquet), read as bytes; for text formats, read as string
-                    if self._format == "parquet":
-                        with fs.open(file_path_str, mode="rb") as f:
-                            content = f.read()
-                    else:
-                        with fs.open(
-                            file_path_str, mode="r", encoding=self._encoding
-                        ) as f:
-                            content = f.read()
-
-                    # Use format handler to read batches
-                    yield from self._format_handler.read_batches(
-                        content,
-                        file_path_str,
-                        batch_size=self._batch_size,
-                        encoding=self._encoding,
-                    )
-                except Exception as e:
-                    raise ConnectorError(
-                        f"Failed to read file: {e}",
-                        context={
-                            "path": file_path_str,
-                            "backend": self._backend,
-                            "format": self._format,
-                        },
-                    ) from e
+            fs = self._get_read_filesystem()
+            # Background downloads only for uncached remote reads (with cache_dir
+            # set, repeated reads already come from local disk) or when local
+            # read-ahead was asked for
+            prefetch_files = self._prefetch_files
+            remote_pool = self._backend != "local" and not self._cache_dir
+            pool = (
+                ThreadPoolExecutor(max_workers=max(prefetch_files, RANGE_WORKERS))
+                if remote_pool
+                else (
+                    ThreadPoolExecutor(max_workers=prefetch_files)
+                    if self._backend == "local" and self._prefetch_local
+                    else None
+                )
+            )
+            prefetched: dict[int, Future[bytes] | None] = {}
+            try:
+                for index, file_info in enumerate(files):
+                    if pool is not None and prefetch_files:
+                        # Keep the next files downloading while this one is parsed
+                        for ahead in range(
+                            index, min(index + prefetch_files + 1, len(files))
+                        ):
+                            if ahead not in prefetched:
+                                prefetched[ahead] = self._prefetch_file(
+                                    pool, fs, files[ahead]
+                                )
+                    future = prefetched.pop(index, None)
+
+                    file_path = file_info["path"]
+                    # Ensure file_path is a string (not a Path object) for fsspec
+                    file_path_str = str(file_path)
+
+                    try:
+                        # Hand the open file to the format handler so it can parse
+                        # incrementally instead of loading the whole file first
+                        if future is not None:
+                            stream = BytesIO(future.result())
+                        elif remote_pool and self._use_range_reads(file_info):
+                            stream = BufferedReader(
+                                _RangeReader(
+                                    fs,
+                                    file_path_str,
+                                    file_info["size"],
+                                    pool,
+                                    chunk_size=min(
+                                        RANGE_CHUNK_SIZE,
+                                        -(-file_info["size"] // RANGE_WORKERS),
+                                    ),
+                                    window=RANGE_WORKERS,
+                                ),
+                                buffer_size=2**20,
+                            )
+                        else:
+                            stream = fs.open(
+                                file_path_str, mode="rb", **self._open_options
+                            )
+                        with stream as f:
+                            if file_path_str.lower().endswith(GZIP_EXTENSION):
+                                # GzipFile leaves closing the wrapped stream to us
+                                f = gzip.GzipFile(fileobj=f, mode="rb")
+                            yield from self._format_handler.read_stream(
+                                f,
+                                file_path_str,
+                                batch_size=self._batch_size,
+                                encoding=self._encoding,
+                                **self._read_options,
+                            )
+                    except Exception as e:
+                        raise ConnectorError(
+                            f"Failed to read file: {e}",
+                            context={
+                                "path": file_path_str,
+                                "backend": self._backend,
+                                "format": self._format,
+                            },
+                        ) from e
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
 
         except ConnectorError:
             raise
@@ -445,6 +792,41 @@ class FileStoreConnector:
                 },
             ) from e
 
+    def _prefetch_file(
+        self,
+        pool: ThreadPoolExecutor,
+        fs: AbstractFileSystem,
+        file_info: dict[str, Any],
+    ) -> Future[bytes] | None:
+        """Start downloading a small file in the background.
+
+        Returns None for files that are too large (or of unknown size) to hold in
+        memory; those are streamed when their turn comes.
+        """
+        size = file_info.get("size")
+        if size is None or size > PREFETCH_MAX_FILE_SIZE:
+            return None
+        return pool.submit(self._read_file_bytes, fs, str(file_info["path"]))
+
+    def _use_range_reads(self, file_info: dict[str, Any]) -> bool:
+        """Return whether a remote file should be downloaded as parallel ranges."""
+        size = file_info.get("size")
+        return (
+            size is not None
+            and size > RANGE_MIN_FILE_SIZE
+            and self._format_handler.sequential_stream
+        )
+
+    @staticmethod
+    def _read_file_bytes(fs: AbstractFileSystem, file_path: str) -> bytes:
+        """Read a whole file as bytes.
+
+        cat_file issues a single GET with no file-object buffering. On async
+        backends (s3fs, gcsfs, adlfs) the calls from the pool threads all run on
+        fsspec's shared event loop and session, as fs.cat(paths) would.
+        """
+        return fs.cat_file(file_path)
+
     # ========== Writing methods ==========
 
     def _generate_file_path(self, batch: Batch) -> str:
@@ -453,37 +835,45 @@ class FileStoreConnector:
         Returns just the filename (e.g., 'data_20241221_123456_0001.csv').
         The base path will be combined in _build_file_url.
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         self._batch_counter += 1
-
-        # Get extension from format handler (use first extension)
-        ext = (
-            self._format_handler.extensions[0]
-            if self._format_handler.extensions
-            else ".dat"
+        return (
+            f"data_{datetime.now(timezone.utc):%Y%m%d_%H%M%S}"
+            f"_{self._batch_counter:04d}{self._file_extension}"
         )
 
-        return f"data_{timestamp}_{self._batch_counter:04d}{ext}"
+    def _build_write_url(self, file_name: str) -> str:
+        """Build the URL for a generated file name.
+
+        Only the file name changes between batches, so the URL prefix is taken
+        from the first _build_file_url result and reused for later batches.
+        """
+        prefix = self._write_url_prefix
+        if prefix is None:
+            file_url = self._build_file_url(file_name)
+            if not file_url.endswith(file_name):
+                # The destination is a single file that every batch writes to
+                return file_url
+            prefix = self._write_url_prefix = file_url[: -len(file_name)]
+        return prefix + file_name
 
     def _get_base_path_url(self) -> str:
         """Get the base path URL for the configured backend."""
-        # For S3FileStoreConfig, construct from bucket + path
-        if isinstance(self._config, S3FileStoreConfig):
-            bucket = self._config.bucket
-            path_prefix = self._path.rstrip("/") if self._path else ""
-            if path_prefix:
-                return f"s3://{bucket}/{path_prefix}/"
-            else:
-                return f"s3://{bucket}/"
-        else:
-            # For other backends, use the configured path
-            if self._path.startswith(
-                ("s3://", "gs://", "az://", "abfss://", "file://")
-            ):
-                return self._path.rstrip("/") + "/"
+        if self._base_path_url is None:
+            # For S3FileStoreConfig, construct from bucket + path
+            if isinstance(self._config, S3FileStoreConfig):
+                bucket = self._config.bucket
+                path_prefix = self._path.rstrip("/") if self._path else ""
+                if path_prefix:
+                    self._base_path_url = f"s3://{bucket}/{path_prefix}/"
+                else:
+                    self._base_path_url = f"s3://{bucket}/"
+            elif self._path.startswith(URL_SCHEMES):
+                # For other backends, use the configured path
+                self._base_path_url = self._path.rstrip("/") + "/"
             else:
                 # Local filesystem - ensure it's a directory path
-                return str(Path(self._path).resolve())
+                self._base_path_url = str(Path(self._path).resolve())
+        return self._base_path_url
 
     def _delete_existing_files(self) -> None:
         """Delete existing files at the destination path (for overwrite mode).
@@ -494,15 +884,12 @@ class FileStoreConnector:
         file_url = self._get_base_path_url()
 
         try:
-            if fs.isdir(file_url):
-                # List and delete all files matching the format extensions
-                valid_extensions = self._format_handler.extensions
-                for file_path in fs.find(file_url):
-                    if any(
-                        file_path.lower().endswith(ext.lower())
-                        for ext in valid_extensions
-                    ):
-                        fs.rm(file_path)
+            if self._is_dir(fs, file_url):
+                # Delete all files matching the format extensions in one call,
+                # which s3fs batches into DeleteObjects requests
+                to_delete = list(self._find_format_files(fs, file_url))
+                if to_delete:
+                    fs.rm(to_delete)
             elif fs.exists(file_url):
                 # Single file, delete it
                 fs.rm(file_url)
@@ -521,12 +908,13 @@ class FileStoreConnector:
         path_url = self._get_base_path_url()
 
         try:
-            if fs.isdir(path_url):
+            if self._is_dir(fs, path_url):
                 # Delete entire directory recursively
                 fs.rm(path_url, recursive=True)
             elif fs.exists(path_url):
                 # Single file or path, delete it
                 fs.rm(path_url, recursive=True)
+            self._known_dirs.clear()
         except Exception as e:
             raise ConnectorError(
                 f"Failed to delete entire path for full refresh: {e}",
@@ -561,22 +949,28 @@ class FileStoreConnector:
                 context={"path": self._path, "write_mode": self._write_mode},
             )
 
-        # Handle overwrite/full refresh on first batch
-        if self._batch_counter == 0:
-            if full_refresh:
-                # Full refresh: delete entire prefix/path (destructive)
-                self._delete_entire_path()
-            elif self._write_mode == "overwrite":
-                # Default overwrite: delete matching files only
-                self._delete_existing_files()
-
-        if not batch.rows:
-            return
-
-        # Generate file path and convert to format using format handler
-        file_path = self._generate_file_path(batch)
-        file_url = self._build_file_url(file_path)
+        with self._write_lock:
+            # Handle overwrite/full refresh on first batch
+            if self._batch_counter == 0:
+                if full_refresh:
+                    # Full refresh: delete entire prefix/path (destructive)
+                    self._delete_entire_path()
+                elif self._write_mode == "overwrite":
+                    # Default overwrite: delete matching files only
+                    self._delete_existing_files()
+
+            # row_count avoids materializing the rows just to test for emptiness
+            if batch.row_count == 0:
+                return
+
+            # Generate file path; the counter keeps concurrent writes distinct
+            file_path = self._generate_file_path(batch)
+
+        # Convert to format using format handler
+        file_url = self._build_write_url(file_path)
         file_content = self._format_handler.write_batch(batch, encoding=self._encoding)
+        if self._compression:
+            file_content = gzip.compress(file_content, compresslevel=GZIP_COMPRESSLEVEL)
 
         # Write using fsspec (always binary mode since format handler returns bytes)
         fs = self._get_filesystem()
@@ -601,9 +995,10 @@ class FileStoreConnector:
                     ):
                         fs.makedirs(parent_dir, exist_ok=True)
 
-            with fs.open(file_url, mode="wb") as f:
-                f.write(file_content)
-            self._written_files.append(file_url)
+            # The content is already in memory, so upload it in one call (a single
+            # PutObject, or a parallel multipart upload for large S3 payloads)
+            # instead of going through a buffered file object
+            fs.pipe_file(file_url, file_content, **self._pipe_options)
         except Exception as e:
             raise ConnectorError(
                 f"Failed to write file: {e}",
@@ -614,10 +1009,20 @@ class FileStoreConnector:
                 },
             ) from e
 
+        with self._write_lock:
+            self._written_files.append(file_url)
+            self._written_files_view = None
+
     @property
-    def written_files(self) -> list[str]:
-        """Return list of files written during this session."""
-        return self._written_files.copy()
+    def written_files(self) -> tuple[str, ...]:
+        """Return the files written during this session.
+
+        The same immutable snapshot is returned until another file is written,
+        so repeated access does not copy the list.
+        """
+        if self._written_files_view is None:
+            self._written_files_view = tuple(self._written_files)
+        return self._written_files_view
 
 
 @register_connector("filestore")
@@ -4,14 +4,26 @@ This module provides format handlers for reading and writing different file form
 Supports CSV, JSON, JSONL, and Parquet formats, with extensibility for custom formats.
 """
 
+import codecs
 import csv
+import functools
+import itertools
 import json
+import operator
 from abc import ABC, abstractmethod
 from io import BytesIO, StringIO, TextIOWrapper
-from typing import Any, Iterable
+from typing import Any, BinaryIO, Iterable, Iterator
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 from dataloader.core.batch import ArrowBatch, Batch
 from dataloader.core.exceptions import ConnectorError
 
@@ -35,6 +47,15 @@ class Format(ABC):
         """Return list of file extensions for this format (e.g., ['.csv'], ['.json', '.jsonl'])."""
         ...
 
+    @property
+    def sequential_stream(self) -> bool:
+        """Return whether read_stream() only reads the stream front to back.
+
+        Sequential formats may be given a non-seekable stream, which lets large
+        remote files be downloaded as parallel byte ranges. Defaults to False.
+        """
+        return False
+
     @abstractmethod
     def read_batches(
         self,
@@ -58,6 +79,38 @@ class Format(ABC):
         """
         ...
 
+    def read_stream(
+        self,
+        stream: BinaryIO,
+        file_path: str,
+        batch_size: int = 1000,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> Iterable[ArrowBatch]:
+        """Read batches from an open binary file object.
+
+        The default implementation reads the whole stream and delegates to
+        read_batches(). Formats that can parse incrementally override it so
+        memory use is bounded by the batch size rather than the file size.
+
+        Args:
+            stream: File object opened in binary mode.
+            file_path: Original file path (for metadata).
+            batch_size: Maximum rows per batch.
+            encoding: Text encoding (for text formats).
+            **kwargs: Format-specific options.
+
+        Yields:
+            ArrowBatch instances containing the data.
+        """
+        yield from self.read_batches(
+            stream.read(),
+            file_path,
+            batch_size=batch_size,
+            encoding=encoding,
+            **kwargs,
+        )
+
     @abstractmethod
     def write_batch(
         self, batch: Batch, encoding: str = "utf-8", **kwargs: Any
@@ -75,6 +128,106 @@ class Format(ABC):
         ...
 
 
+# Rows sampled from the start of a CSV file to infer its column types
+CSV_SAMPLE_ROWS = 100
+
+# Value patterns for CSV type inference, mirroring what int(), float() and
+# datetime.strptime() accept
+_INT_PATTERN = r"^\s*[+-]?\d+(_\d+)*\s*$"
+_FLOAT_PATTERN = (
+    r"(?i)^\s*[+-]?(\d+(_\d+)*(\.(\d+(_\d+)*)?)?|\.\d+(_\d+)*)(e[+-]?\d+(_\d+)*)?\s*$"
+    r"|^\s*[+-]?(inf|infinity|nan)\s*$"
+)
+_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+)
+
+
+def _type_votes(values: pa.StringArray | pa.ChunkedArray) -> dict[str, int]:
+    """Count the values that parse as int, float (but not int) and datetime."""
+    is_int = pc.match_substring_regex(values, _INT_PATTERN)
+    is_float = pc.and_(
+        pc.invert(is_int), pc.match_substring_regex(values, _FLOAT_PATTERN)
+    )
+    is_datetime = pc.is_valid(
+        pc.strptime(values, format=_DATETIME_FORMATS[0], unit="s", error_is_null=True)
+    )
+    for fmt in _DATETIME_FORMATS[1:]:
+        is_datetime = pc.or_(
+            is_datetime,
+            pc.is_valid(pc.strptime(values, format=fmt, unit="s", error_is_null=True)),
+        )
+    is_datetime = pc.and_(pc.invert(pc.or_(is_int, is_float)), is_datetime)
+    return {
+        "int": pc.sum(is_int).as_py() or 0,
+        "float": pc.sum(is_float).as_py() or 0,
+        "datetime": pc.sum(is_datetime).as_py() or 0,
+    }
+
+
+def _rechunk(
+    record_batches: Iterable[pa.RecordBatch], batch_size: int
+) -> Iterator[pa.Table]:
+    """Regroup Arrow record batches into tables of batch_size rows.
+
+    Slices are zero-copy; only the final table may be shorter.
+    """
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for record_batch in record_batches:
+        if record_batch.num_rows == 0:
+            continue
+        pending.append(record_batch)
+        pending_rows += record_batch.num_rows
+        if pending_rows < batch_size:
+            continue
+
+        table = pa.Table.from_batches(pending)
+        offset = 0
+        while pending_rows - offset >= batch_size:
+            yield table.slice(offset, batch_size)
+            offset += batch_size
+        rest = table.slice(offset)
+        pending = rest.to_batches()
+        pending_rows = rest.num_rows
+
+    if pending_rows:
+        yield pa.Table.from_batches(pending)
+
+
+def _arrow_csv_writable(arrow_type: pa.DataType) -> bool:
+    """Return whether Arrow's CSV writer renders a type's values like str() does.
+
+    Floats and timestamps are excluded: Arrow writes 2.0 as "2" (which would be
+    read back as an int) and adds fractional seconds to every timestamp.
+    """
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_integer(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+        or pa.types.is_date32(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+# Rows per row group in written Parquet files; filtered reads skip whole row
+# groups, so smaller groups prune more finely
+PARQUET_ROW_GROUP_SIZE = 128_000
+
+
+# Arrow's CSV reader can keep every column as a string (matching the csv module)
+# only on pyarrow versions with ConvertOptions.default_column_type
+_ARROW_CSV_STRINGS = hasattr(pa_csv.ConvertOptions, "default_column_type")
+
+# Arrow's CSV writer can produce the csv module's dialect (no quoting, CRLF row
+# endings) only on pyarrow versions with WriteOptions.quoting_header
+_ARROW_CSV_DIALECT = hasattr(pa_csv.WriteOptions, "quoting_header")
+
+
 class CSVFormat(Format):
     """CSV format handler."""
 
@@ -96,65 +249,45 @@ class CSVFormat(Format):
     def extensions(self) -> list[str]:
         return [".csv"]
 
-    def _infer_type(self, value: str) -> str:
-        """Infer the type of a string value."""
-        if not value or value.strip() == "":
-            return "string"
-
-        try:
-            int(value)
-            return "int"
-        except ValueError:
-            pass
-
-        try:
-            float(value)
-            return "float"
-        except ValueError:
-            pass
-
-        # Try common datetime formats
-        from datetime import datetime
-
-        datetime_formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-        ]
-        for fmt in datetime_formats:
-            try:
-                datetime.strptime(value, fmt)
-                return "datetime"
-            except ValueError:
-                continue
-
-        return "string"
+    @property
+    def sequential_stream(self) -> bool:
+        return True
 
     def _infer_schema(
         self, columns: list[str], sample_rows: list[list[str]]
     ) -> dict[str, str]:
-        """Infer column types from sample rows."""
+        """Infer column types from sample rows.
+
+        Each value votes for int, float, datetime or string; a column takes the
+        first of datetime, float and int that at least half the rows vote for.
+        Values are classified a column at a time with Arrow compute kernels.
+        """
         if not sample_rows:
             return {col: "string" for col in columns}
 
-        type_votes: dict[str, dict[str, int]] = {col: {} for col in columns}
-
-        for row in sample_rows:
-            for i, col in enumerate(columns):
-                if i < len(row):
-                    inferred = self._infer_type(row[i])
-                    type_votes[col][inferred] = type_votes[col].get(inferred, 0) + 1
+        # Short rows give nulls, which vote for nothing
+        return self._infer_column_types(
+            columns,
+            [
+                pa.array(
+                    [row[i] if i < len(row) else None for row in sample_rows],
+                    type=pa.string(),
+                )
+                for i in range(len(columns))
+            ],
+        )
 
+    @staticmethod
+    def _infer_column_types(
+        columns: list[str], sample: list[pa.StringArray | pa.ChunkedArray]
+    ) -> dict[str, str]:
+        """Infer column types from sampled string columns (see _infer_schema)."""
         schema = {}
-        for col in columns:
-            votes = type_votes[col]
-            if not votes:
-                schema[col] = "string"
-                continue
-
+        for col, values in zip(columns, sample):
+            threshold = len(values) * 0.5
+            votes = _type_votes(values)
             for preferred_type in ["datetime", "float", "int"]:
-                if votes.get(preferred_type, 0) >= len(sample_rows) * 0.5:
+                if votes[preferred_type] >= threshold:
                     schema[col] = preferred_type
                     break
             else:
@@ -171,13 +304,52 @@ class CSVFormat(Format):
         **kwargs: Any,
     ) -> Iterable[ArrowBatch]:
         """Read batches from CSV content."""
-        # Convert bytes to string if needed
-        if isinstance(content, bytes):
-            content_str = content.decode(encoding)
+        if _ARROW_CSV_STRINGS:
+            if isinstance(content, str):
+                content, encoding = content.encode("utf-8"), "utf-8"
+            # A native reader over the bytes lets Arrow parse them in place,
+            # without calling back into a Python file object for each block
+            yield from self._read_arrow(
+                pa.BufferReader(content), file_path, batch_size, encoding
+            )
+        elif isinstance(content, bytes):
+            # Decode incrementally rather than building a decoded copy of the
+            # whole file (BytesIO shares the bytes object until written to)
+            yield from self.read_stream(
+                BytesIO(content), file_path, batch_size=batch_size, encoding=encoding
+            )
         else:
-            content_str = content
+            yield from self._read_text(StringIO(content), file_path, batch_size)
+
+    def read_stream(
+        self,
+        stream: BinaryIO,
+        file_path: str,
+        batch_size: int = 1000,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> Iterable[ArrowBatch]:
+        """Read batches from a binary CSV stream, parsing rows incrementally.
+
+        Uses Arrow's multithreaded CSV parser when available; values stay strings,
+        as with the csv module fallback.
+        """
+        if _ARROW_CSV_STRINGS:
+            yield from self._read_arrow(stream, file_path, batch_size, encoding)
+            return
 
-        reader = csv.reader(StringIO(content_str), delimiter=self._delimiter)
+        text = TextIOWrapper(stream, encoding=encoding, newline="")
+        try:
+            yield from self._read_text(text, file_path, batch_size)
+        finally:
+            # Leave closing the underlying stream to its owner
+            text.detach()
+
+    def _read_text(
+        self, text: Iterable[str], file_path: str, batch_size: int
+    ) -> Iterator[ArrowBatch]:
+        """Parse CSV text into batches, holding at most one batch of rows."""
+        reader = csv.reader(text, delimiter=self._delimiter)
         rows_buffer: list[list[str]] = []
 
         # Handle header
@@ -193,18 +365,14 @@ class CSVFormat(Format):
             columns = [f"col_{i}" for i in range(len(first_row))]
             rows_buffer.append(first_row)
 
-        # Read all rows into buffer
-        for row in reader:
-            rows_buffer.append(row)
-
-        # Infer schema from first 100 rows
-        schema_sample = rows_buffer[: min(100, len(rows_buffer))]
-        column_types = self._infer_schema(columns, schema_sample)
+        # Infer schema from the first rows, then stream the rest batch by batch
+        rows_buffer.extend(itertools.islice(reader, CSV_SAMPLE_ROWS - len(rows_buffer)))
+        column_types = self._infer_schema(columns, rows_buffer)
 
         # Yield in batches
+        rows = itertools.chain(rows_buffer, reader)
         batch_number = 0
-        for i in range(0, len(rows_buffer), batch_size):
-            batch_rows = rows_buffer[i : i + batch_size]
+        while batch_rows := list(itertools.islice(rows, batch_size)):
             batch_number += 1
 
             yield ArrowBatch.from_rows(
@@ -219,16 +387,167 @@ class CSVFormat(Format):
                 },
             )
 
+    def _read_arrow(
+        self, stream: BinaryIO, file_path: str, batch_size: int, encoding: str
+    ) -> Iterator[ArrowBatch]:
+        """Parse a CSV stream with Arrow's streaming reader into batches."""
+        try:
+            reader = pa_csv.open_csv(
+                stream,
+                read_options=pa_csv.ReadOptions(
+                    encoding=encoding,
+                    autogenerate_column_names=not self._has_header,
+                ),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=self._delimiter, newlines_in_values=True
+                ),
+                convert_options=pa_csv.ConvertOptions(default_column_type=pa.string()),
+            )
+        except pa.ArrowInvalid as e:
+            if "Empty CSV file" in str(e):
+                return
+            raise
+
+        columns = reader.schema.names
+        if not self._has_header:
+            columns = [f"col_{i}" for i in range(len(columns))]
+
+        tables = _rechunk(reader, batch_size)
+
+        # Hold back batches until enough rows are seen to infer the schema
+        head: list[pa.Table] = []
+        sampled = 0
+        for table in tables:
+            head.append(table)
+            sampled += table.num_rows
+            if sampled >= CSV_SAMPLE_ROWS:
+                break
+        if not head:
+            return
+        # Classify the sampled columns as they are, without a round trip through
+        # Python rows
+        sample = pa.concat_tables(head).slice(0, CSV_SAMPLE_ROWS)
+        column_types = self._infer_column_types(columns, sample.columns)
+
+        batch_number = 0
+        for table in itertools.chain(head, tables):
+            batch_number += 1
+            yield ArrowBatch(
+                table.rename_columns(columns),
+                metadata={
+                    "batch_number": batch_number,
+                    "row_count": table.num_rows,
+                    "format": "csv",
+                    "file_path": file_path,
+                    "column_types": column_types,
+                },
+            )
+
     def write_batch(
         self, batch: Batch, encoding: str = "utf-8", **kwargs: Any
     ) -> bytes:
-        """Convert batch to CSV string."""
-        output = StringIO()
-        writer = csv.writer(output, delimiter=self._delimiter)
+        """Convert batch to CSV bytes.
+
+        Arrow batches whose columns Arrow renders as the csv module would (see
+        _arrow_csv_writable) are written by Arrow's native CSV writer with the
+        csv module's dialect, so the output bytes never depend on the schema.
+        Arrow cannot quote only the values that need it, so batches with a
+        delimiter, quote or line break in any value (or header) fall back to
+        the csv module. There, rows are encoded as they are written, so the
+        whole file never exists as an intermediate str alongside its encoded
+        bytes.
+        """
+        if _ARROW_CSV_DIALECT and isinstance(batch, ArrowBatch) and _is_utf8(encoding):
+            table = batch.to_arrow()
+            # The csv module quotes an empty value when it is a row's only field
+            if table.num_columns > 1 and all(
+                _arrow_csv_writable(field.type) for field in table.schema
+            ):
+                try:
+                    return self._write_arrow(table)
+                except pa.ArrowInvalid:
+                    pass
+
+        output = BytesIO()
+        text = TextIOWrapper(output, encoding=encoding, newline="")
+        writer = csv.writer(text, delimiter=self._delimiter)
         if self._has_header:
             writer.writerow(batch.columns)
         writer.writerows(batch.rows)
-        return output.getvalue().encode(encoding)
+        text.flush()
+        text.detach()
+        return output.getvalue()
+
+    def _write_arrow(self, table: pa.Table) -> bytes:
+        """Write an Arrow table as CSV bytes with Arrow's CSV writer."""
+        # Spell booleans like str(bool) does; nulls stay empty
+        for i, field in enumerate(table.schema):
+            if pa.types.is_boolean(field.type):
+                table = table.set_column(
+                    i,
+                    field.name,
+                    pc.if_else(table.column(i), "True", "False"),
+                )
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(
+            table,
+            sink,
+            write_options=pa_csv.WriteOptions(
+                include_header=self._has_header,
+                delimiter=self._delimiter,
+                eol="\r\n",
+                quoting_style="none",
+                quoting_header="none",
+            ),
+        )
+        return sink.getvalue().to_pybytes()
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Return whether encoding names UTF-8 (the only encoding orjson handles)."""
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, with orjson when it is installed.
+
+    orjson rejects a few documents the json module accepts (NaN and Infinity
+    literals, integers beyond 64 bits); those are parsed again with json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _batch_records(batch: Batch) -> list[dict[str, Any]]:
+    """Return a batch's rows as dicts keyed by column name.
+
+    Arrow-backed batches build the dicts natively with Table.to_pylist().
+    """
+    if isinstance(batch, ArrowBatch):
+        return batch.to_arrow().to_pylist()
+    columns = batch.columns
+    return [dict(zip(columns, row)) for row in batch.rows]
+
+
+def _record_columns(
+    records: list[dict[str, Any]], columns: list[str]
+) -> dict[str, Any]:
+    """Split parsed objects into per-column value sequences.
+
+    Objects carrying every column go through a single itemgetter call each;
+    if any object lacks a key, fall back to dict.get so it becomes a null.
+    """
+    if len(columns) > 1:
+        getter = operator.itemgetter(*columns)
+        try:
+            return dict(zip(columns, zip(*map(getter, records))))
+        except (KeyError, TypeError):
+            pass
+    return {col: [record.get(col) for record in records] for col in columns}
 
 
 class JSONFormat(Format):
@@ -250,6 +569,10 @@ class JSONFormat(Format):
     def extensions(self) -> list[str]:
         return [".json"]
 
+    @property
+    def sequential_stream(self) -> bool:
+        return True
+
     def read_batches(
         self,
         content: str | bytes,
@@ -259,14 +582,12 @@ class JSONFormat(Format):
         **kwargs: Any,
     ) -> Iterable[ArrowBatch]:
         """Read batches from JSON content."""
-        # Convert bytes to string if needed
-        if isinstance(content, bytes):
-            content_str = content.decode(encoding)
-        else:
-            content_str = content
+        # UTF-8 bytes are parsed as they are; other encodings are decoded first
+        if isinstance(content, bytes) and not _is_utf8(encoding):
+            content = content.decode(encoding)
 
         try:
-            data = json.loads(content_str)
+            data = _json_loads(content)
         except json.JSONDecodeError as e:
             raise ConnectorError(
                 f"Failed to parse JSON: {e}",
@@ -297,18 +618,14 @@ class JSONFormat(Format):
 
         columns = list(first_row.keys())
 
-        # Convert rows to list format
-        row_data = [[row.get(col) for col in columns] for row in rows]
-
-        # Yield in batches
+        # Yield in batches, building each column straight from the objects
         batch_number = 0
-        for i in range(0, len(row_data), batch_size):
-            batch_rows = row_data[i : i + batch_size]
+        for i in range(0, len(rows), batch_size):
+            batch_rows = rows[i : i + batch_size]
             batch_number += 1
 
-            yield ArrowBatch.from_rows(
-                columns=columns,
-                rows=batch_rows,
+            yield ArrowBatch.from_columns(
+                _record_columns(batch_rows, columns),
                 metadata={
                     "batch_number": batch_number,
                     "row_count": len(batch_rows),
@@ -321,10 +638,13 @@ class JSONFormat(Format):
         self, batch: Batch, encoding: str = "utf-8", **kwargs: Any
     ) -> bytes:
         """Convert batch to JSON array."""
-        # Convert rows to dict format
-        rows = [
-            {col: val for col, val in zip(batch.columns, row)} for row in batch.rows
-        ]
+        rows = _batch_records(batch)
+        if orjson is not None and _is_utf8(encoding):
+            try:
+                # orjson writes UTF-8 bytes directly, indented like json below
+                return orjson.dumps(rows, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                pass  # Values orjson cannot write are left to json
         json_str = json.dumps(rows, indent=2, ensure_ascii=False)
         return json_str.encode(encoding)
 
@@ -348,6 +668,10 @@ class JSONLFormat(Format):
     def extensions(self) -> list[str]:
         return [".jsonl", ".ndjson"]
 
+    @property
+    def sequential_stream(self) -> bool:
+        return True
+
     def read_batches(
         self,
         content: str | bytes,
@@ -357,90 +681,150 @@ class JSONLFormat(Format):
         **kwargs: Any,
     ) -> Iterable[ArrowBatch]:
         """Read batches from JSONL content."""
-        # Convert bytes to string if needed
         if isinstance(content, bytes):
-            content_str = content.decode(encoding)
+            yield from self.read_stream(
+                BytesIO(content), file_path, batch_size=batch_size, encoding=encoding
+            )
         else:
-            content_str = content
+            yield from self._read_lines(StringIO(content), file_path, batch_size)
 
-        lines = content_str.strip().split("\n")
-        if not lines or (len(lines) == 1 and not lines[0].strip()):
+    def read_stream(
+        self,
+        stream: BinaryIO,
+        file_path: str,
+        batch_size: int = 1000,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> Iterable[ArrowBatch]:
+        """Read batches from a binary JSONL stream, parsing line by line."""
+        if orjson is not None and _is_utf8(encoding):
+            # orjson parses UTF-8 bytes, so lines need no decoding
+            yield from self._read_lines(stream, file_path, batch_size)
             return
 
-        # Parse first line to get columns
+        text = TextIOWrapper(stream, encoding=encoding)
         try:
-            first_obj = json.loads(lines[0])
-        except json.JSONDecodeError as e:
-            raise ConnectorError(
-                f"Failed to parse JSONL line 1: {e}",
-                context={"file_path": file_path},
-            ) from e
-
-        if not isinstance(first_obj, dict):
-            raise ConnectorError(
-                "JSONL must contain JSON objects, one per line",
-                context={"file_path": file_path},
-            )
-
-        columns = list(first_obj.keys())
+            yield from self._read_lines(text, file_path, batch_size)
+        finally:
+            # Leave closing the underlying stream to its owner
+            text.detach()
+
+    def _read_lines(
+        self, lines: Iterable[str] | Iterable[bytes], file_path: str, batch_size: int
+    ) -> Iterator[ArrowBatch]:
+        """Parse JSONL lines into batches, holding at most one batch of objects."""
+        columns: list[str] | None = None
+        rows: list[dict[str, Any]] = []
+        batch_number = 0
 
-        # Parse all lines
-        rows: list[list[Any]] = []
         for line_num, line in enumerate(lines, 1):
             if not line.strip():
                 continue
             try:
-                obj = json.loads(line)
-                if not isinstance(obj, dict):
-                    raise ConnectorError(
-                        f"JSONL line {line_num} is not an object",
-                        context={"file_path": file_path, "line": line_num},
-                    )
-                rows.append([obj.get(col) for col in columns])
+                obj = _json_loads(line)
             except json.JSONDecodeError as e:
                 raise ConnectorError(
                     f"Failed to parse JSONL line {line_num}: {e}",
                     context={"file_path": file_path, "line": line_num},
                 ) from e
 
-        # Yield in batches
-        batch_number = 0
-        for i in range(0, len(rows), batch_size):
-            batch_rows = rows[i : i + batch_size]
+            if not isinstance(obj, dict):
+                if columns is None:
+                    raise ConnectorError(
+                        "JSONL must contain JSON objects, one per line",
+                        context={"file_path": file_path},
+                    )
+                raise ConnectorError(
+                    f"JSONL line {line_num} is not an object",
+                    context={"file_path": file_path, "line": line_num},
+                )
+
+            # Columns come from the first object
+            if columns is None:
+                columns = list(obj.keys())
+            rows.append(obj)
+
+            if len(rows) == batch_size:
+                batch_number += 1
+                yield self._build_batch(columns, rows, batch_number, file_path)
+                rows = []
+
+        if rows:
             batch_number += 1
+            yield self._build_batch(columns, rows, batch_number, file_path)
 
-            yield ArrowBatch.from_rows(
-                columns=columns,
-                rows=batch_rows,
-                metadata={
-                    "batch_number": batch_number,
-                    "row_count": len(batch_rows),
-                    "format": "jsonl",
-                    "file_path": file_path,
-                },
+    def _build_batch(
+        self,
+        columns: list[str],
+        rows: list[dict[str, Any]],
+        batch_number: int,
+        file_path: str,
+    ) -> ArrowBatch:
+        """Build an ArrowBatch with JSONL metadata.
+
+        Columns are built straight from the parsed objects; keys missing from an
+        object become nulls and keys not in the first object are dropped.
+        """
+        if not columns:
+            raise ConnectorError(
+                "JSONL objects must have at least one key",
+                context={"file_path": file_path},
             )
+        return ArrowBatch.from_columns(
+            _record_columns(rows, columns),
+            metadata={
+                "batch_number": batch_number,
+                "row_count": len(rows),
+                "format": "jsonl",
+                "file_path": file_path,
+            },
+        )
 
     def write_batch(
         self, batch: Batch, encoding: str = "utf-8", **kwargs: Any
     ) -> bytes:
         """Convert batch to JSONL format (one JSON object per line)."""
-        lines = []
-        for row in batch.rows:
-            obj = {col: val for col, val in zip(batch.columns, row)}
-            lines.append(json.dumps(obj, ensure_ascii=False))
-        return "\n".join(lines).encode(encoding)
+        records = _batch_records(batch)
+        if orjson is not None and _is_utf8(encoding):
+            try:
+                return b"\n".join(orjson.dumps(obj) for obj in records)
+            except orjson.JSONEncodeError:
+                pass  # Values orjson cannot write are left to json
+        return "\n".join(json.dumps(obj, ensure_ascii=False) for obj in records).encode(
+            encoding
+        )
 
 
 class ParquetFormat(Format):
     """Parquet format handler using pandas."""
 
-    def __init__(self, **kwargs: Any):
+    def __init__(
+        self,
+        compression: str | None = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int | None = PARQUET_ROW_GROUP_SIZE,
+        **kwargs: Any,
+    ):
         """Initialize Parquet format handler.
 
         Args:
+            compression: Codec for written files (zstd compresses smaller than
+                pyarrow's snappy default at a similar speed).
+            compression_level: Codec level; None uses 3 for zstd and the codec's
+                own default otherwise.
+            row_group_size: Maximum rows per row group in written files.
             **kwargs: Ignored (for compatibility with get_format).
         """
-        pass
+        if compression_level is None and compression == "zstd":
+            compression_level = 3
+        # Statistics are pyarrow's default, but readers need them to skip row
+        # groups, so they are requested explicitly
+        self._write_options: dict[str, Any] = {
+            "compression": compression,
+            "compression_level": compression_level,
+            "row_group_size": row_group_size,
+            "write_statistics": True,
+        }
 
     @property
     def name(self) -> str:
@@ -466,37 +850,91 @@ class ParquetFormat(Format):
                 context={"file_path": file_path},
             )
 
+        # A native reader serves footer and column chunk reads without going
+        # through a Python file object
+        yield from self._read_parquet(
+            pa.BufferReader(content), file_path, batch_size, **kwargs
+        )
+
+    def read_stream(
+        self,
+        stream: BinaryIO,
+        file_path: str,
+        batch_size: int = 1000,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> Iterable[ArrowBatch]:
+        """Read batches from a seekable binary Parquet stream.
+
+        PyArrow reads the footer and column chunks straight from the file object,
+        so the file is never copied into an intermediate bytes buffer.
+        """
+        yield from self._read_parquet(stream, file_path, batch_size, **kwargs)
+
+    def _read_parquet(
+        self,
+        source: BinaryIO | pa.NativeFile,
+        file_path: str,
+        batch_size: int,
+        columns: list[str] | None = None,
+        filters: list | pc.Expression | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ArrowBatch]:
+        """Read a Parquet file object and yield it in batches.
+
+        Row groups are decoded one batch at a time, so only the current batch
+        (not the whole file) is held in memory. Only the given columns are
+        decoded. With filters (a pyarrow expression or DNF list such as
+        [("id", ">", 10)]), row groups whose statistics rule the filter out
+        are skipped and the remaining rows are filtered as they are decoded.
+        """
         try:
-            # Read parquet from bytes using PyArrow
-            parquet_file = pq.ParquetFile(BytesIO(content))
-            table = parquet_file.read(**kwargs)
+            if filters is None:
+                tables: Iterable[pa.Table] = (
+                    pa.Table.from_batches([record_batch])
+                    for record_batch in pq.ParquetFile(source).iter_batches(
+                        batch_size=batch_size, columns=columns, **kwargs
+                    )
+                )
+            else:
+                # Imported here so reads without filters skip loading the module
+                import pyarrow.dataset as ds
+
+                if not isinstance(filters, pc.Expression):
+                    filters = pq.filters_to_expression(filters)
+                fragment = ds.ParquetFileFormat().make_fragment(source)
+                # Filtered batches come out short, so regroup them to batch_size
+                tables = _rechunk(
+                    fragment.to_batches(
+                        filter=filters, columns=columns, batch_size=batch_size
+                    ),
+                    batch_size,
+                )
+
+            column_types = None
+            batch_number = 0
+            for table in tables:
+                if column_types is None:
+                    column_types = {f.name: str(f.type) for f in table.schema}
+                batch_number += 1
+                yield ArrowBatch(
+                    table,
+                    metadata={
+                        "batch_number": batch_number,
+                        "row_count": table.num_rows,
+                        "format": "parquet",
+                        "file_path": file_path,
+                        "column_types": column_types,
+                    },
+                )
+        except ConnectorError:
+            raise
         except Exception as e:
             raise ConnectorError(
                 f"Failed to read Parquet: {e}",
                 context={"file_path": file_path},
             ) from e
 
-        columns = table.column_names
-        column_types = {col: str(table.schema.field(col).type) for col in columns}
-
-        # Yield in batches
-        batch_number = 0
-        for i in range(0, table.num_rows, batch_size):
-            end_idx = min(i + batch_size, table.num_rows)
-            batch_table = table.slice(i, end_idx - i)
-            batch_number += 1
-
-            yield ArrowBatch(
-                batch_table,
-                metadata={
-                    "batch_number": batch_number,
-                    "row_count": batch_table.num_rows,
-                    "format": "parquet",
-                    "file_path": file_path,
-                    "column_types": column_types,
-                },
-            )
-
     def write_batch(
         self, batch: ArrowBatch, encoding: str = "utf-8", **kwargs: Any
     ) -> bytes:
@@ -505,10 +943,10 @@ class ParquetFormat(Format):
             # Get Arrow table from batch
             arrow_table = batch.to_arrow()
 
-            # Write to bytes buffer
-            buffer = BytesIO()
-            pq.write_table(arrow_table, buffer, **kwargs)
-            return buffer.getvalue()
+            # Write to an Arrow-native buffer
+            sink = pa.BufferOutputStream()
+            pq.write_table(arrow_table, sink, **{**self._write_options, **kwargs})
+            return sink.getvalue().to_pybytes()
         except Exception as e:
             raise ConnectorError(
                 f"Failed to write Parquet: {e}",
@@ -542,6 +980,27 @@ def register_format(format_class: type[Format]) -> type[Format]:
     return format_class
 
 
+@functools.lru_cache(maxsize=32)
+def _get_builtin_format(
+    format_name_lower: str, options: tuple[tuple[str, Any], ...]
+) -> Format | None:
+    """Build the handler for a built-in format, or None for other names.
+
+    Built-in handlers hold only their options, so one instance per name and
+    options is shared by every connector. Custom formats are not cached.
+    """
+    kwargs = dict(options)
+    if format_name_lower == "csv":
+        return CSVFormat(**kwargs)
+    elif format_name_lower == "json":
+        return JSONFormat(**kwargs)
+    elif format_name_lower == "jsonl":
+        return JSONLFormat(**kwargs)
+    elif format_name_lower == "parquet":
+        return ParquetFormat(**kwargs)
+    return None
+
+
 def get_format(format_name: str, **kwargs: Any) -> Format:
     """Get a format handler by name.
 
@@ -558,15 +1017,16 @@ def get_format(format_name: str, **kwargs: Any) -> Format:
     format_name_lower = format_name.lower()
 
     # Built-in formats
-    if format_name_lower == "csv":
-        return CSVFormat(**kwargs)
-    elif format_name_lower == "json":
-        return JSONFormat(**kwargs)
-    elif format_name_lower == "jsonl":
-        return JSONLFormat(**kwargs)
-    elif format_name_lower == "parquet":
-        return ParquetFormat(**kwargs)
-    elif format_name_lower in _format_registry:
+    options = tuple(sorted(kwargs.items()))
+    try:
+        format_handler = _get_builtin_format(format_name_lower, options)
+    except TypeError:
+        # Unhashable option values can't be cached; build a fresh handler
+        format_handler = _get_builtin_format.__wrapped__(format_name_lower, options)
+    if format_handler is not None:
+        return format_handler
+
+    if format_name_lower in _format_registry:
         # Custom format
         return _format_registry[format_name_lower](**kwargs)
     else:
@@ -25,8 +25,17 @@ class PostgresConnectorConfig(BaseModel):
     )
     db_schema: Optional[str] = Field(default="public", description="Database schema")
     table: str = Field(description="Table name")
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer: skip connection pre-ping and recycle pooled connections every 60s",
+    )
 
     # Source-specific fields (for reading)
+    batch_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Rows per read batch (sized from the table schema when unset)",
+    )
     incremental: Optional[IncrementalConfig] = Field(
         default=None, description="Incremental loading configuration (for reads)"
     )
@@ -39,6 +48,14 @@ class PostgresConnectorConfig(BaseModel):
         default=None,
         description="Key columns for merge mode (required when write_mode='merge')",
     )
+    unlogged_bulk: bool = Field(
+        default=False,
+        description=(
+            "Overwrite loads: create the table UNLOGGED (set LOGGED on close) "
+            "and commit with synchronous_commit off. Faster, but a server crash "
+            "during the load loses the table's rows"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_fields(self):
@@ -1,6 +1,8 @@
 """PostgreSQL connector for reading and writing data using SQLAlchemy."""
 
-from typing import Any, Iterable, Union
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterable, Iterator, Union
 
 from dataloader.connectors.registry import ConnectorConfigUnion, register_connector
 
@@ -10,6 +12,7 @@ except ImportError:
     pd = None  # type: ignore
 
 import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 try:
     from sqlalchemy import create_engine, inspect, text
@@ -41,6 +44,19 @@ class PostgresConnector:
     """
 
     DEFAULT_BATCH_SIZE = 1000
+    # Read batches are sized so one batch of fixed-width values fills about
+    # an L2 cache slice, within these bounds
+    TARGET_BATCH_BYTES = 256 * 1024
+    MIN_BATCH_SIZE = 2048
+    MAX_BATCH_SIZE = 65536
+    # Assumed width of a variable-length value (strings, binary, unknown types)
+    VARIABLE_WIDTH_BYTES = 32
+    # Seconds before pooled connections are replaced when behind PgBouncer
+    PGBOUNCER_POOL_RECYCLE = 60
+    # Connections kept open, plus extra ones allowed under load, so concurrent
+    # write_batch calls (runtime parallelism > 1) each get their own
+    POOL_SIZE = 4
+    MAX_OVERFLOW = 4
     DEFAULT_PORT = 5432
     DIALECT = "postgresql+psycopg2"
 
@@ -57,10 +73,10 @@ class PostgresConnector:
         Raises:
             ImportError: If required dependencies are not installed (install with: pip install dataloader[postgres])
         """
-        if create_engine is None or pd is None:
+        if create_engine is None:
             raise ImportError(
-                "PostgresConnector requires sqlalchemy and pandas. "
-                "Install them with: pip install dataloader[postgres]"
+                "PostgresConnector requires sqlalchemy. "
+                "Install it with: pip install dataloader[postgres]"
             )
         self._config = config
 
@@ -106,9 +122,26 @@ class PostgresConnector:
             self._write_mode = config.write_mode
             self._merge_keys = config.merge_keys
 
-        self._batch_size = self.DEFAULT_BATCH_SIZE
+        self._pgbouncer = bool(getattr(config, "pgbouncer", False))
+        # Overwrite loads trade crash safety for less WAL traffic when enabled
+        self._unlogged_bulk = self._write_mode == "overwrite" and bool(
+            getattr(config, "unlogged_bulk", False)
+        )
+        self._unlogged_table = False
+        # None sizes read batches from the table schema
+        self._batch_size: int | None = getattr(config, "batch_size", None)
         self._engine: Engine | None = None
         self._table_created = False
+        # Destination table columns, cached after the first catalog lookup
+        self._columns_cache: set[str] | None = None
+        # Schema the table was last prepared for; batches matching it skip DDL
+        self._written_schema: pa.Schema | None = None
+        # Serializes table setup between concurrent write_batch calls
+        self._write_lock = threading.Lock()
+        # Connection held across sequential write_batch calls
+        self._write_conn: Any = None
+        self._write_conn_stack = ExitStack()
+        self._write_conn_lock = threading.Lock()
         self._type_mapper = PostgresTypeMapper()
 
     def _build_connection_url(self) -> str:
@@ -126,12 +159,21 @@ class PostgresConnector:
         if self._engine is None:
             try:
                 url = self._build_connection_url()
-                # Pool settings for batch operations
+                # Pool settings for batch operations. Behind PgBouncer the
+                # pre-ping SELECT 1 is skipped (it leaves server connections
+                # idle in transaction) and connections are recycled instead
+                if self._pgbouncer:
+                    ping_options = {
+                        "pool_pre_ping": False,
+                        "pool_recycle": self.PGBOUNCER_POOL_RECYCLE,
+                    }
+                else:
+                    ping_options = {"pool_pre_ping": True}
                 self._engine = create_engine(
                     url,
-                    pool_pre_ping=True,
-                    pool_size=1,
-                    max_overflow=0,
+                    pool_size=self.POOL_SIZE,
+                    max_overflow=self.MAX_OVERFLOW,
+                    **ping_options,
                 )
             except SQLAlchemyError as e:
                 raise ConnectorError(
@@ -145,6 +187,7 @@ class PostgresConnector:
 
     def _close(self) -> None:
         """Dispose of the engine and close connections."""
+        self._release_write_connection()
         if self._engine is not None:
             self._engine.dispose()
             self._engine = None
@@ -174,6 +217,32 @@ class PostgresConnector:
             result.append((col_name, arrow_type))
         return result
 
+    def _rows_per_batch(self, schema_info: list[tuple[str, pa.DataType]]) -> int:
+        """Return the read batch size, estimating it from the schema if unset.
+
+        Args:
+            schema_info: (column_name, arrow_type) tuples from _get_schema().
+
+        Returns:
+            Number of rows to fetch per batch.
+        """
+        if self._batch_size is not None:
+            return self._batch_size
+        if not schema_info:
+            return self.DEFAULT_BATCH_SIZE
+
+        row_bytes = 0
+        for _, arrow_type in schema_info:
+            try:
+                row_bytes += max(arrow_type.bit_width // 8, 1)
+            except ValueError:
+                # Variable-width type
+                row_bytes += self.VARIABLE_WIDTH_BYTES
+        return max(
+            self.MIN_BATCH_SIZE,
+            min(self.MAX_BATCH_SIZE, self.TARGET_BATCH_BYTES // row_bytes),
+        )
+
     def _build_query(self, state: State) -> tuple[str, dict[str, Any]]:
         """Build SELECT query with optional cursor-based filtering.
 
@@ -204,7 +273,8 @@ class PostgresConnector:
     def read_batches(self, state: State) -> Iterable[ArrowBatch]:
         """Read data from PostgreSQL table as batches.
 
-        Uses SQLAlchemy with pandas to read data efficiently, then converts to Arrow.
+        Streams rows through a server-side cursor and builds each Arrow batch
+        straight from the fetched rows, without a pandas DataFrame in between.
 
         Args:
             state: Current state containing cursor values for incremental reads.
@@ -221,33 +291,37 @@ class PostgresConnector:
             columns = [col[0] for col in schema_info]
             # Convert Arrow types to string for metadata
             column_types = {col[0]: str(col[1]) for col in schema_info}
+            batch_size = self._rows_per_batch(schema_info)
 
             query, params = self._build_query(state)
 
-            # Use pandas read_sql with chunksize for memory-efficient reading
-            # Use engine directly (not connection) for better pandas compatibility
+            # yield_per streams through a server-side cursor that fetches
+            # batch_size rows per round trip, so one batch is held at a time
             batch_number = 0
-            for chunk_df in pd.read_sql(
-                query, engine, params=params, chunksize=self._batch_size
-            ):
-                if chunk_df.empty:
-                    break
-
-                # Convert pandas DataFrame to Arrow Table
-                arrow_table = pa.Table.from_pandas(chunk_df)
-
-                batch_number += 1
-                yield ArrowBatch(
-                    arrow_table,
-                    metadata={
-                        "batch_number": batch_number,
-                        "row_count": len(chunk_df),
-                        "source_type": "postgres",
-                        "table": self._table,
-                        "schema": self._db_schema,
-                        "column_types": column_types,
-                    },
+            with engine.connect() as conn:
+                result = conn.execution_options(yield_per=batch_size).execute(
+                    text(query), params
                 )
+                result_columns = list(result.keys())
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+
+                    batch_number += 1
+                    # Rows from one result all share its width, so transpose
+                    # them into columns without from_rows' length checks
+                    yield ArrowBatch.from_columns(
+                        dict(zip(result_columns, zip(*rows))),
+                        metadata={
+                            "batch_number": batch_number,
+                            "row_count": len(rows),
+                            "source_type": "postgres",
+                            "table": self._table,
+                            "schema": self._db_schema,
+                            "column_types": column_types,
+                        },
+                    )
 
         except SQLAlchemyError as e:
             raise ConnectorError(
@@ -257,19 +331,27 @@ class PostgresConnector:
                     "schema": self._db_schema,
                 },
             ) from e
-        finally:
-            self._close()
 
     # ========== Writing methods ==========
 
     def _get_existing_columns(self, conn: Any) -> set[str]:
-        """Get existing columns for the table."""
+        """Get existing columns for the table.
+
+        The first lookup that finds the table is cached; _create_table and
+        _add_missing_columns keep the cache current, so later batches skip the
+        catalog query.
+        """
+        if self._columns_cache is not None:
+            return self._columns_cache
         try:
             inspector = inspect(self._get_engine())
             columns = inspector.get_columns(self._table, schema=self._db_schema)
-            return {col["name"] for col in columns}
         except Exception:
             return set()
+        existing = {col["name"] for col in columns}
+        if existing:
+            self._columns_cache = existing
+        return existing
 
     def _map_arrow_type_to_postgres(self, arrow_type: pa.DataType) -> str:
         """Map Arrow type to PostgreSQL type (delegates to TypeMapper)."""
@@ -277,25 +359,22 @@ class PostgresConnector:
 
     def _create_table(self, conn: Any, batch: ArrowBatch) -> None:
         """Create table from batch schema if it doesn't exist."""
-        # Get Arrow schema to determine column types
-        arrow_table = batch.to_arrow()
-        arrow_schema = arrow_table.schema
-
-        # Build column definitions from Arrow schema
-        column_defs = []
-        for col_name in batch.columns:
-            arrow_field = arrow_schema.field(col_name)
-            pg_type = self._map_arrow_type_to_postgres(arrow_field.type)
-            column_defs.append(f'"{col_name}" {pg_type}')
-
+        # Build column definitions in one pass over the Arrow schema's fields
+        arrow_schema = batch.to_arrow().schema
+        column_defs = [
+            f'"{field.name}" {self._map_arrow_type_to_postgres(field.type)}'
+            for field in arrow_schema
+        ]
         columns_sql = ", ".join(column_defs)
 
+        # An UNLOGGED table skips WAL while it is loaded; close() sets it LOGGED
+        create = "CREATE UNLOGGED TABLE" if self._unlogged_bulk else "CREATE TABLE"
         try:
             conn.execute(
-                text(
-                    f"CREATE TABLE IF NOT EXISTS {self._qualified_table} ({columns_sql})"
-                )
+                text(f"{create} IF NOT EXISTS {self._qualified_table} ({columns_sql})")
             )
+            self._columns_cache = set(arrow_schema.names)
+            self._unlogged_table = self._unlogged_bulk
         except SQLAlchemyError as e:
             raise ConnectorError(
                 f"Failed to create table: {e}",
@@ -303,27 +382,33 @@ class PostgresConnector:
             ) from e
 
     def _add_missing_columns(self, conn: Any, batch: ArrowBatch) -> None:
-        """Add columns that exist in batch but not in table (schema evolution)."""
+        """Add columns that exist in batch but not in table (schema evolution).
+
+        All missing columns are added by one ALTER TABLE statement.
+        """
         existing = self._get_existing_columns(conn)
-        arrow_table = batch.to_arrow()
-        arrow_schema = arrow_table.schema
+        missing_fields = [
+            field for field in batch.to_arrow().schema if field.name not in existing
+        ]
+        if not missing_fields:
+            return
 
-        for col_name in batch.columns:
-            if col_name not in existing:
-                arrow_field = arrow_schema.field(col_name)
-                pg_type = self._map_arrow_type_to_postgres(arrow_field.type)
+        missing = [field.name for field in missing_fields]
+        add_clauses = [
+            f'ADD COLUMN "{field.name}" {self._map_arrow_type_to_postgres(field.type)}'
+            for field in missing_fields
+        ]
 
-                try:
-                    conn.execute(
-                        text(
-                            f'ALTER TABLE {self._qualified_table} ADD COLUMN "{col_name}" {pg_type}'
-                        )
-                    )
-                except SQLAlchemyError as e:
-                    raise ConnectorError(
-                        f"Failed to add column '{col_name}': {e}",
-                        context={"table": self._table, "column": col_name},
-                    ) from e
+        try:
+            conn.execute(
+                text(f"ALTER TABLE {self._qualified_table} {', '.join(add_clauses)}")
+            )
+        except SQLAlchemyError as e:
+            raise ConnectorError(
+                f"Failed to add columns {missing}: {e}",
+                context={"table": self._table, "columns": missing},
+            ) from e
+        existing.update(missing)
 
     def _handle_write_mode(
         self, conn: Any, batch: ArrowBatch, full_refresh: bool = False
@@ -348,22 +433,21 @@ class PostgresConnector:
                 # Always create after drop in full_refresh mode
                 self._create_table(conn, batch)
                 self._table_created = True
+            elif not self._get_existing_columns(conn):
+                # Overwrite into a missing table: create it. Check first, since a
+                # failed TRUNCATE would abort the transaction the CREATE runs in.
+                self._create_table(conn, batch)
+                self._table_created = True
             else:
                 # Default overwrite: truncate table (preserves structure)
                 try:
                     conn.execute(text(f"TRUNCATE TABLE {self._qualified_table}"))
                     self._table_created = True
                 except SQLAlchemyError as e:
-                    # If table doesn't exist, create it
-                    existing = self._get_existing_columns(conn)
-                    if not existing:
-                        self._create_table(conn, batch)
-                        self._table_created = True
-                    else:
-                        raise ConnectorError(
-                            f"Failed to truncate table for overwrite: {e}",
-                            context={"table": self._table},
-                        ) from e
+                    raise ConnectorError(
+                        f"Failed to truncate table for overwrite: {e}",
+                        context={"table": self._table},
+                    ) from e
 
         elif self._write_mode == "merge":
             # Merge not supported in v0.1
@@ -392,28 +476,65 @@ class PostgresConnector:
                     self._add_missing_columns(conn, batch)
             self._table_created = True
 
+    def _copy_sql(self, columns: list[str]) -> str:
+        """Build the COPY statement that loads CSV rows for the given columns."""
+        columns_sql = ", ".join(f'"{col}"' for col in columns)
+        return (
+            f"COPY {self._qualified_table} ({columns_sql}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+
     def _insert_batch(self, conn: Any, batch: ArrowBatch) -> None:
-        """Insert batch rows using pandas to_sql for efficient bulk inserts."""
+        """Insert batch rows with COPY FROM STDIN.
+
+        Arrow renders the batch as CSV in C++ and the bytes are streamed to the
+        server, which parses them into the table's column types. Nulls are
+        written as unquoted empty fields and empty strings as "", matching
+        COPY's CSV rules. Binary values are sent in bytea's hex format (see
+        _hex_encode_binary). Column types Arrow cannot write as CSV (lists,
+        structs) fall back to a pandas multi-row INSERT.
+        """
         if batch.row_count == 0:
             return
 
+        arrow_table = batch.to_arrow()
         try:
-            # Convert Arrow table to pandas DataFrame
-            arrow_table = batch.to_arrow()
-            df = arrow_table.to_pandas()
-
-            # Use pandas to_sql with engine for efficient bulk insert
-            # pandas.to_sql works with SQLAlchemy engine or connection
-            engine = self._get_engine()
-            df.to_sql(
-                self._table,
-                engine,
-                schema=self._db_schema,
-                if_exists="append",
-                index=False,
-                method="multi",  # Use multi-row insert for better performance
-            )
-        except SQLAlchemyError as e:
+            sink = pa.BufferOutputStream()
+            copy_table = self._hex_encode_binary(arrow_table)
+            try:
+                pa_csv.write_csv(
+                    copy_table,
+                    sink,
+                    write_options=pa_csv.WriteOptions(include_header=False),
+                )
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                if pd is None:
+                    raise ConnectorError(
+                        "Writing list or struct columns to PostgreSQL requires "
+                        "pandas. Install it with: pip install dataloader[postgres]",
+                        context={"table": self._table, "columns": batch.columns},
+                    )
+                df = arrow_table.to_pandas()
+                df.to_sql(
+                    self._table,
+                    conn,
+                    schema=self._db_schema,
+                    if_exists="append",
+                    index=False,
+                    method="multi",
+                )
+                return
+
+            # COPY is a psycopg2 cursor method, so use the DBAPI connection
+            # behind this SQLAlchemy connection (same transaction)
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    self._copy_sql(arrow_table.column_names),
+                    pa.BufferReader(sink.getvalue()),
+                )
+        except ConnectorError:
+            raise
+        except Exception as e:
             raise ConnectorError(
                 f"Failed to insert batch: {e}",
                 context={
@@ -423,11 +544,64 @@ class PostgresConnector:
                 },
             ) from e
 
+    def _hex_encode_binary(self, table: pa.Table) -> pa.Table:
+        """Replace binary columns with their bytea hex text (e.g. "\\x0102").
+
+        Arrow writes binary values to CSV as raw bytes, which COPY would decode
+        as text. The hex form loads into BYTEA columns as the original bytes,
+        and into text columns as the same string psycopg2 sends for bytes.
+        """
+        for i, field in enumerate(table.schema):
+            if (
+                pa.types.is_binary(field.type)
+                or pa.types.is_large_binary(field.type)
+                or pa.types.is_fixed_size_binary(field.type)
+            ):
+                encoded = pa.array(
+                    [
+                        None if value is None else "\\x" + value.hex()
+                        for value in table.column(i).to_pylist()
+                    ],
+                    type=pa.string(),
+                )
+                table = table.set_column(i, field.name, encoded)
+        return table
+
+    @contextmanager
+    def _write_connection(self) -> Iterator[Any]:
+        """Yield the connection one write_batch call runs on.
+
+        Sequential writes reuse a held connection, so each batch skips a pool
+        checkout and its pre-ping query. A call that finds it in use by another
+        thread checks out a pooled connection instead. A failed write releases
+        the held connection (rolling back) so the next batch starts fresh.
+        """
+        if not self._write_conn_lock.acquire(blocking=False):
+            with self._get_engine().connect() as conn:
+                yield conn
+            return
+        try:
+            if self._write_conn is None:
+                self._write_conn = self._write_conn_stack.enter_context(
+                    self._get_engine().connect()
+                )
+            yield self._write_conn
+        except BaseException:
+            self._release_write_connection()
+            raise
+        finally:
+            self._write_conn_lock.release()
+
+    def _release_write_connection(self) -> None:
+        """Close the held write connection, if any, returning it to the pool."""
+        self._write_conn = None
+        self._write_conn_stack.close()
+
     def write_batch(self, batch: ArrowBatch, state: State) -> None:
         """Write a batch to PostgreSQL table.
 
         Creates the table if it doesn't exist, handles schema evolution
-        for new columns, and inserts rows using parameterized queries.
+        for new columns, and loads rows with COPY FROM STDIN.
 
         Args:
             batch: Batch of data to write.
@@ -441,14 +615,55 @@ class PostgresConnector:
         # PostgreSQL supports full_refresh (DROP TABLE operations)
         # If full_refresh were not supported, raise ConnectorError here with a clear message
 
-        engine = self._get_engine()
-        with engine.connect() as conn:
-            self._handle_write_mode(conn, batch, full_refresh=full_refresh)
+        schema = batch.to_arrow().schema
+        with self._write_lock:
+            self._get_engine()
+        with self._write_connection() as conn:
+            # Once the table is set up, a batch with the schema it was prepared
+            # for needs no DDL or column checks. Setup runs under the lock and
+            # is committed before the COPY, so concurrent writers see the table
+            # and copy into it on their own connections.
+            if not self._is_prepared(schema):
+                with self._write_lock:
+                    if not self._is_prepared(schema):
+                        self._handle_write_mode(conn, batch, full_refresh=full_refresh)
+                        conn.commit()
+                        self._written_schema = schema
+            if self._unlogged_bulk:
+                # Don't wait for the WAL flush on commit (this transaction only)
+                conn.execute(text("SET LOCAL synchronous_commit TO OFF"))
             self._insert_batch(conn, batch)
+            conn.commit()
+
+    def _is_prepared(self, schema: pa.Schema) -> bool:
+        """Return True if the table is set up for batches with this schema."""
+        return (
+            self._table_created
+            and self._written_schema is not None
+            and schema.equals(self._written_schema)
+        )
+
+    def _set_logged(self) -> None:
+        """Make a table created UNLOGGED for an overwrite load durable again."""
+        if not self._unlogged_table:
+            return
+        self._unlogged_table = False
+        with self._write_connection() as conn:
+            try:
+                conn.execute(text(f"ALTER TABLE {self._qualified_table} SET LOGGED"))
+                conn.commit()
+            except SQLAlchemyError as e:
+                raise ConnectorError(
+                    f"Failed to set table logged: {e}",
+                    context={"table": self._table},
+                ) from e
 
     def close(self) -> None:
         """Close the PostgreSQL connection."""
-        self._close()
+        try:
+            self._set_logged()
+        finally:
+            self._close()
 
 
 @register_connector("postgres")
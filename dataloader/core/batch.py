@@ -1,6 +1,6 @@
 """Batch protocol and implementation for data batches."""
 
-from typing import Any, Protocol
+from typing import Any, Protocol, Sequence
 
 import pyarrow as pa
 
@@ -96,12 +96,8 @@ class ArrowBatch:
                         f"Row {i} length {len(row)} does not match column count {len(columns)}"
                     )
 
-            # Convert rows (list of lists) to list of dicts for PyArrow
-            # Each row becomes a dict with column names as keys
-            row_dicts = [dict(zip(columns, row)) for row in rows]
-
-            # Create Arrow table from list of dicts (PyArrow infers types)
-            table = pa.Table.from_pylist(row_dicts, schema=None)
+            # Transpose rows into one sequence per column for PyArrow
+            return cls.from_columns(dict(zip(columns, zip(*rows))), metadata)
         else:
             # Empty batch - create table with empty arrays
             # Use pa.null() type as placeholder (will be inferred on first data)
@@ -110,6 +106,33 @@ class ArrowBatch:
 
         return cls(table, metadata)
 
+    @classmethod
+    def from_columns(
+        cls,
+        column_data: dict[str, Sequence[Any]],
+        metadata: dict[str, Any] | None = None,
+    ) -> "ArrowBatch":
+        """Create ArrowBatch from per-column value sequences.
+
+        Builds each Arrow array straight from its column's values, without going
+        through a row-oriented representation.
+
+        Args:
+            column_data: Mapping of column name to that column's values
+            metadata: Optional metadata dictionary
+
+        Returns:
+            ArrowBatch instance
+
+        Raises:
+            ValueError: If column_data is empty or columns differ in length
+        """
+        if len(column_data) == 0:
+            raise ValueError("columns cannot be empty")
+
+        # PyArrow infers each column's type from its values
+        return cls(pa.Table.from_pydict(column_data), metadata)
+
     @property
     def columns(self) -> list[str]:
         """Return column names from Arrow schema."""
@@ -121,12 +144,11 @@ class ArrowBatch:
 
         Converts Arrow table to list of lists maintaining column order.
         """
-        # Convert to list of dicts first (PyArrow's efficient method)
-        dict_list = self._table.to_pylist()
-
-        # Convert list of dicts to list of lists in column order
-        column_names = self.columns
-        return [[row[col] for col in column_names] for row in dict_list]
+        # Convert column by column, then transpose into rows
+        return [
+            list(row)
+            for row in zip(*(column.to_pylist() for column in self._table.columns))
+        ]
 
     @property
     def row_count(self) -> int:
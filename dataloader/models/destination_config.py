@@ -30,6 +30,28 @@ class DestinationConfig(BaseModel):
     table: Optional[str] = Field(
         default=None, description="Table name (required for database connectors)"
     )
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer: skip connection pre-ping and recycle pooled connections every 60s",
+    )
+
+    # DuckDB connector fields
+    threads: Optional[int] = Field(
+        default=None, description="Number of DuckDB worker threads"
+    )
+    memory_limit: Optional[str] = Field(
+        default=None, description="DuckDB memory limit (e.g., '4GB')"
+    )
+    temp_directory: Optional[str] = Field(
+        default=None, description="Directory DuckDB spills to when over memory_limit"
+    )
+    preserve_insertion_order: bool = Field(
+        default=False,
+        description=(
+            "Keep rows in load order when writing to DuckDB. Disabled by default "
+            "for faster bulk loads"
+        ),
+    )
 
     # FileStore connector fields
     backend: Optional[str] = Field(
@@ -44,6 +66,10 @@ class DestinationConfig(BaseModel):
         default=None,
         description="File format (e.g., 'csv', 'json', 'jsonl', 'parquet')",
     )
+    compression: Optional[Literal["gzip"]] = Field(
+        default=None,
+        description="Gzip-compress written files and read .gz files (csv, json, jsonl)",
+    )
     region: Optional[str] = Field(default=None, description="AWS region")
     access_key: Optional[str] = Field(
         default=None, description="AWS access key (supports templates)"
@@ -59,6 +85,14 @@ class DestinationConfig(BaseModel):
         default=None,
         description="Key columns for merge mode (required when write_mode='merge')",
     )
+    unlogged_bulk: bool = Field(
+        default=False,
+        description=(
+            "Postgres overwrite loads: create the table UNLOGGED (set LOGGED on close) "
+            "and commit with synchronous_commit off. Faster, but a server crash "
+            "during the load loses the table's rows"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_fields(self):
@@ -1,6 +1,6 @@
 """Source configuration model for recipe definitions."""
 
-from typing import Literal, Optional
+from typing import Any, List, Literal, Optional
 
 from pydantic import BaseModel, Field, SecretStr, model_validator
 
@@ -41,6 +41,26 @@ class SourceConfig(BaseModel):
     table: Optional[str] = Field(
         default=None, description="Table name (required for database connectors)"
     )
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer: skip connection pre-ping and recycle pooled connections every 60s",
+    )
+    batch_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Rows per read batch (Postgres sizes batches from the table schema when unset)",
+    )
+
+    # DuckDB connector fields
+    threads: Optional[int] = Field(
+        default=None, description="Number of DuckDB worker threads"
+    )
+    memory_limit: Optional[str] = Field(
+        default=None, description="DuckDB memory limit (e.g., '4GB')"
+    )
+    temp_directory: Optional[str] = Field(
+        default=None, description="Directory DuckDB spills to when over memory_limit"
+    )
 
     # FileStore connector fields
     backend: Optional[str] = Field(
@@ -55,6 +75,10 @@ class SourceConfig(BaseModel):
         default=None,
         description="File format (e.g., 'csv', 'json', 'jsonl', 'parquet')",
     )
+    compression: Optional[Literal["gzip"]] = Field(
+        default=None,
+        description="Gzip-compress written files and read .gz files (csv, json, jsonl)",
+    )
     region: Optional[str] = Field(default=None, description="AWS region")
     access_key: Optional[str] = Field(
         default=None, description="AWS access key (supports templates)"
@@ -62,6 +86,28 @@ class SourceConfig(BaseModel):
     secret_key: Optional[SecretStr] = Field(
         default=None, description="AWS secret key (supports templates)"
     )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Local directory for caching remote files between reads",
+    )
+    cache_expiry: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to trust cached files without re-checking the remote copy",
+    )
+    prefetch_files: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Files to read ahead of the one being parsed (remote by default, local when set); 0 disables",
+    )
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Columns to read from Parquet files",
+    )
+    filters: Optional[List[List[Any]]] = Field(
+        default=None,
+        description='Parquet row filters in pyarrow DNF form, e.g. [["id", ">", 10]]',
+    )
 
     # API connector fields
     base_url: Optional[str] = Field(
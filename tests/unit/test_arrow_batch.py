@@ -127,6 +127,30 @@ class TestArrowBatch:
         with pytest.raises(ValueError, match="columns cannot be empty"):
             ArrowBatch.from_rows(columns, rows)
 
+    def test_from_columns_basic(self):
+        """Test ArrowBatch.from_columns() builds the same batch as from_rows()."""
+        metadata = {"source": "test"}
+
+        batch = ArrowBatch.from_columns(
+            {"id": [1, 2], "name": ["Alice", None], "score": (1.5, 2.0)}, metadata
+        )
+
+        assert batch.columns == ["id", "name", "score"]
+        assert batch.rows == [[1, "Alice", 1.5], [2, None, 2.0]]
+        assert batch.metadata == metadata
+        assert batch.to_arrow().equals(
+            ArrowBatch.from_rows(
+                ["id", "name", "score"], [[1, "Alice", 1.5], [2, None, 2.0]]
+            ).to_arrow()
+        )
+
+    def test_from_columns_validation_errors(self):
+        """Test that from_columns() rejects no columns and uneven columns."""
+        with pytest.raises(ValueError, match="columns cannot be empty"):
+            ArrowBatch.from_columns({})
+        with pytest.raises(ValueError):
+            ArrowBatch.from_columns({"id": [1, 2], "name": ["Alice"]})
+
     def test_columns_property(self):
         """Test columns property returns correct column names."""
         table = pa.table({"a": [1], "b": [2], "c": [3]})
@@ -1,8 +1,11 @@
 """Unit tests for DuckDBConnector."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import pyarrow as pa
 import pytest
 
 from dataloader.connectors.duckdb.connector import (
@@ -54,6 +57,14 @@ class TestDuckDBConnector:
             table="users",
         )
 
+    def test_importing_dataloader_does_not_import_duckdb(self):
+        """Test that duckdb is only imported once a connector is constructed."""
+        code = "import sys, dataloader; print('duckdb' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
     def test_duckdb_connector_initialization(self, duckdb_config: DestinationConfig):
         """Test that DuckDBConnector initializes correctly."""
         connector = DuckDBConnector(duckdb_config)
@@ -102,6 +113,39 @@ class TestDuckDBConnector:
         # Verify file was created
         assert Path(file_based_config.database).exists()
 
+    def test_duckdb_file_connectors_keep_their_own_settings(
+        self, file_based_config: DestinationConfig, sample_batch: ArrowBatch
+    ):
+        """Test that connectors on one file don't change each other's settings."""
+        database = file_based_config.database
+        ordered_config = file_based_config.model_copy(
+            update={"table": "ordered", "preserve_insertion_order": True}
+        )
+        ordered = DuckDBConnector(ordered_config)
+        writer = DuckDBConnector(file_based_config)
+        reader = DuckDBConnector(
+            SourceConfig(type="duckdb", database=database, table="users")
+        )
+
+        ordered.write_batch(sample_batch, State())
+        writer.write_batch(sample_batch, State())
+        batches = list(reader.read_batches(State()))
+
+        assert sum(batch.row_count for batch in batches) == 3
+        setting = "SELECT current_setting('preserve_insertion_order')"
+        assert writer._get_connection().execute(setting).fetchone()[0] is False
+        assert ordered._get_connection().execute(setting).fetchone()[0] is True
+
+        # DuckDB rejects connect-time settings that differ from the open database
+        conflicting = DuckDBConnector(
+            file_based_config.model_copy(update={"threads": 1})
+        )
+        with pytest.raises(ConnectorError, match="different configuration"):
+            conflicting._get_connection()
+
+        for connector in (ordered, writer, reader):
+            connector.close()
+
     def test_duckdb_table_creation(
         self, duckdb_config: DestinationConfig, sample_batch: ArrowBatch
     ):
@@ -154,6 +198,186 @@ class TestDuckDBConnector:
 
         connector.close()
 
+    def test_duckdb_schema_evolution_adds_multiple_columns(
+        self, duckdb_config: DestinationConfig
+    ):
+        """Test that several new columns are added with their mapped types."""
+        connector = DuckDBConnector(duckdb_config)
+        state = State()
+
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[1]], metadata={}), state
+        )
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["id", "name", "score"],
+                rows=[[2, "Bob", 1.5]],
+                metadata={},
+            ),
+            state,
+        )
+
+        conn = connector._get_connection()
+        column_info = {
+            row[0]: row[1] for row in conn.execute("DESCRIBE test_table").fetchall()
+        }
+        assert column_info == {"id": "BIGINT", "name": "VARCHAR", "score": "DOUBLE"}
+        assert connector._known_columns == {"id", "name", "score"}
+
+        connector.close()
+
+    def test_duckdb_append_looks_up_columns_once(
+        self, duckdb_config: DestinationConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that append mode reuses cached columns after the first batch."""
+        connector = DuckDBConnector(duckdb_config)
+        state = State()
+
+        calls = []
+        original = connector._get_existing_columns
+
+        def counting_get_existing_columns(conn):
+            calls.append(1)
+            return original(conn)
+
+        monkeypatch.setattr(
+            connector, "_get_existing_columns", counting_get_existing_columns
+        )
+
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[1]], metadata={}), state
+        )
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["id", "name"], rows=[[2, "Bob"]], metadata={}
+            ),
+            state,
+        )
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["id", "name"], rows=[[3, "Eve"]], metadata={}
+            ),
+            state,
+        )
+
+        assert len(calls) == 1
+        assert connector._known_columns == {"id", "name"}
+
+        conn = connector._get_connection()
+        result = conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
+        assert result == [(1, None), (2, "Bob"), (3, "Eve")]
+
+    def test_duckdb_same_columns_skip_schema_evolution(
+        self, duckdb_config: DestinationConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that batches repeating the last column set skip type resolution."""
+        connector = DuckDBConnector(duckdb_config)
+        state = State()
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[1]], metadata={}), state
+        )
+
+        calls = []
+        original = connector._resolve_column_types
+
+        def counting_resolve_column_types(batch, skip=None):
+            calls.append(tuple(batch.columns))
+            return original(batch, skip=skip)
+
+        monkeypatch.setattr(
+            connector, "_resolve_column_types", counting_resolve_column_types
+        )
+
+        for row_id in (2, 3):
+            connector.write_batch(
+                ArrowBatch.from_rows(columns=["id"], rows=[[row_id]], metadata={}),
+                state,
+            )
+        assert calls == []
+
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["id", "name"], rows=[[4, "Bob"]], metadata={}
+            ),
+            state,
+        )
+        assert calls == [("id", "name")]
+
+        conn = connector._get_connection()
+        result = conn.execute("SELECT COUNT(*) FROM test_table").fetchone()
+        assert result[0] == 4
+
+        connector.close()
+
+    def test_duckdb_insert_matches_columns_by_name(
+        self, duckdb_config: DestinationConfig, sample_batch: ArrowBatch
+    ):
+        """Test that Arrow inserts match columns by name, not position."""
+        connector = DuckDBConnector(duckdb_config)
+        state = State()
+
+        connector.write_batch(sample_batch, state)
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["score", "id"], rows=[[70.0, 4]], metadata={}
+            ),
+            state,
+        )
+
+        conn = connector._get_connection()
+        result = conn.execute("SELECT * FROM test_table WHERE id = 4").fetchall()
+        assert result == [(4, None, 70.0)]
+
+        connector.close()
+
+    def test_duckdb_insert_non_arrow_batch(self, duckdb_config: DestinationConfig):
+        """Test that batches without an Arrow table fall back to row inserts."""
+
+        class RowBatch:
+            columns = ["id", "name"]
+            rows = [[1, "Alice"], [2, "Bob"]]
+            metadata: dict = {}
+            row_count = 2
+
+        connector = DuckDBConnector(duckdb_config)
+        conn = connector._get_connection()
+        conn.execute("CREATE TABLE test_table (id BIGINT, name VARCHAR)")
+
+        connector._insert_batch(conn, RowBatch())
+
+        result = conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
+        assert result == [(1, "Alice"), (2, "Bob")]
+
+        connector.close()
+
+    def test_duckdb_insert_uses_arrow_view_of_any_batch(
+        self, duckdb_config: DestinationConfig
+    ):
+        """Test that batches exposing to_arrow() skip the row-based insert."""
+
+        class ArrowViewBatch:
+            columns = ["id", "name"]
+            metadata: dict = {}
+            row_count = 2
+
+            def to_arrow(self):
+                return pa.table({"id": [1, 2], "name": ["Alice", "Bob"]})
+
+            @property
+            def rows(self):
+                raise AssertionError("rows should not be materialized")
+
+        connector = DuckDBConnector(duckdb_config)
+        conn = connector._get_connection()
+        conn.execute("CREATE TABLE test_table (id BIGINT, name VARCHAR)")
+
+        connector._insert_batch(conn, ArrowViewBatch())
+
+        result = conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
+        assert result == [(1, "Alice"), (2, "Bob")]
+
+        connector.close()
+
     def test_duckdb_append_mode(self, duckdb_config: DestinationConfig):
         """Test append mode adds rows to existing table."""
         connector = DuckDBConnector(duckdb_config)
@@ -213,6 +437,158 @@ class TestDuckDBConnector:
 
         connector.close()
 
+    def test_duckdb_table_lookup_is_case_insensitive(
+        self, duckdb_config: DestinationConfig
+    ):
+        """Test that an existing mixed-case table is found by a lower-case name."""
+        duckdb_config.table = "events"
+        duckdb_config.write_mode = "overwrite"
+        connector = DuckDBConnector(duckdb_config)
+        conn = connector._get_connection()
+        conn.execute('CREATE TABLE "Events" (id BIGINT)')
+        conn.execute('INSERT INTO "Events" VALUES (1), (2)')
+
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[9]], metadata={}), State()
+        )
+
+        assert conn.execute('SELECT id FROM "Events"').fetchall() == [(9,)]
+
+        append_config = duckdb_config.model_copy(update={"write_mode": "append"})
+        appender = DuckDBConnector(append_config)
+        appender._conn = conn
+        appender.write_batch(
+            ArrowBatch.from_rows(columns=["id", "tag"], rows=[[10, "x"]], metadata={}),
+            State(),
+        )
+
+        assert conn.execute('SELECT id, tag FROM "Events" ORDER BY id').fetchall() == [
+            (9, None),
+            (10, "x"),
+        ]
+
+        connector.close()
+
+    def test_duckdb_connection_settings(self):
+        """Test that configured DuckDB settings are applied on connect and write."""
+        config = DestinationConfig(
+            type="duckdb",
+            database=":memory:",
+            table="test_table",
+            threads=2,
+            memory_limit="1GB",
+        )
+        connector = DuckDBConnector(config)
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[1]], metadata={}), State()
+        )
+
+        conn = connector._get_connection()
+        threads, preserve_order = conn.execute(
+            "SELECT current_setting('threads'), "
+            "current_setting('preserve_insertion_order')"
+        ).fetchone()
+        assert threads == 2
+        assert preserve_order is False
+
+        connector.close()
+
+    def test_duckdb_preserve_insertion_order_opt_in(
+        self, duckdb_config: DestinationConfig, sample_batch: ArrowBatch
+    ):
+        """Test that preserve_insertion_order=True keeps DuckDB's ordered inserts."""
+        duckdb_config.preserve_insertion_order = True
+        connector = DuckDBConnector(duckdb_config)
+        connector.write_batch(sample_batch, State())
+
+        conn = connector._get_connection()
+        result = conn.execute(
+            "SELECT current_setting('preserve_insertion_order')"
+        ).fetchone()
+        assert result[0] is True
+
+        connector.close()
+
+    def test_duckdb_overwrite_mode_evolves_schema_across_batches(
+        self, duckdb_config: DestinationConfig
+    ):
+        """Test that overwrite mode adds new columns from later batches."""
+        duckdb_config.write_mode = "overwrite"
+        connector = DuckDBConnector(duckdb_config)
+        state = State()
+
+        connector.write_batch(
+            ArrowBatch.from_rows(columns=["id"], rows=[[1]], metadata={}), state
+        )
+        connector.write_batch(
+            ArrowBatch.from_rows(
+                columns=["id", "name"], rows=[[2, "Bob"]], metadata={}
+            ),
+            state,
+        )
+
+        conn = connector._get_connection()
+        result = conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
+        assert result == [(1, None), (2, "Bob")]
+
+        connector.close()
+
+    def test_duckdb_failed_write_rolls_back_batch(
+        self, duckdb_config: DestinationConfig, sample_batch: ArrowBatch
+    ):
+        """Test that a failed insert also rolls back the overwrite DELETE."""
+        connector = DuckDBConnector(duckdb_config)
+        connector.write_batch(sample_batch, State())
+
+        duckdb_config.write_mode = "overwrite"
+        connector2 = DuckDBConnector(duckdb_config)
+        connector2._conn = connector._conn  # Share connection for in-memory db
+
+        bad_batch = ArrowBatch.from_rows(
+            columns=["id", "name", "score"],
+            rows=[["not-a-number", "Eve", 90.0]],
+            metadata={},
+        )
+        with pytest.raises(ConnectorError):
+            connector2.write_batch(bad_batch, State())
+
+        conn = connector._get_connection()
+        result = conn.execute("SELECT COUNT(*) FROM test_table").fetchone()
+        assert result[0] == 3
+        assert connector2._table_created is False
+
+        connector.close()
+
+    def test_duckdb_non_duckdb_failure_does_not_poison_next_batch(
+        self,
+        duckdb_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that any failure rolls back, so the next batch can write."""
+        connector = DuckDBConnector(duckdb_config)
+        original_insert = connector._insert_batch
+        calls = []
+
+        def failing_insert(conn, batch):
+            if not calls:
+                calls.append(batch)
+                raise RuntimeError("boom")
+            original_insert(conn, batch)
+
+        monkeypatch.setattr(connector, "_insert_batch", failing_insert)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            connector.write_batch(sample_batch, State())
+        assert connector._table_created is False
+
+        connector.write_batch(sample_batch, State())
+
+        conn = connector._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone()[0] == 3
+
+        connector.close()
+
     def test_duckdb_merge_mode_raises_error(
         self, duckdb_config: DestinationConfig, sample_batch: ArrowBatch
     ):
@@ -421,6 +797,93 @@ class TestDuckDBConnector:
         connector.close()
 
 
+class TestDuckDBConnectorRead:
+    """Tests for reading from DuckDB tables."""
+
+    @pytest.fixture
+    def source_config(self, tmp_path: Path) -> SourceConfig:
+        """Create a DuckDB source config backed by a populated database file."""
+        import duckdb
+
+        db_path = tmp_path / "source.duckdb"
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE TABLE events (id BIGINT, name VARCHAR, score DOUBLE)")
+        conn.execute(
+            "INSERT INTO events VALUES (1, 'a', 1.5), (2, 'b', 2.5), (3, 'c', 3.5)"
+        )
+        conn.close()
+        return SourceConfig(type="duckdb", database=str(db_path), table="events")
+
+    def test_duckdb_read_batches(self, source_config: SourceConfig):
+        """Test reading all rows with column types from the catalog."""
+        connector = DuckDBConnector(source_config)
+
+        batches = list(connector.read_batches(State()))
+
+        assert len(batches) == 1
+        batch = batches[0]
+        assert batch.columns == ["id", "name", "score"]
+        assert sorted(batch.rows) == [[1, "a", 1.5], [2, "b", 2.5], [3, "c", 3.5]]
+        assert batch.metadata["column_types"] == {
+            "id": "int64",
+            "name": "string",
+            "score": "double",
+        }
+
+        connector.close()
+
+    def test_duckdb_read_batches_streams_arrow_chunks(
+        self, source_config: SourceConfig
+    ):
+        """Test that reads are chunked by batch size and keep DuckDB's Arrow types."""
+        import pyarrow as pa
+
+        connector = DuckDBConnector(source_config)
+        connector._batch_size = 2
+
+        batches = list(connector.read_batches(State()))
+
+        assert [batch.row_count for batch in batches] == [2, 1]
+        assert [batch.metadata["batch_number"] for batch in batches] == [1, 2]
+        assert batches[0].to_arrow().schema.field("id").type == pa.int64()
+        assert batches[0].to_arrow().schema.field("score").type == pa.float64()
+
+        connector.close()
+
+    def test_duckdb_read_column_types_from_result_schema(self, tmp_path: Path):
+        """Test that column_types reflect DuckDB's Arrow output for any column type."""
+        import duckdb
+
+        db_path = tmp_path / "typed.duckdb"
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE TABLE prices (id INTEGER, amount DECIMAL(10, 2))")
+        conn.execute("INSERT INTO prices VALUES (1, 9.99)")
+        conn.close()
+
+        connector = DuckDBConnector(
+            SourceConfig(type="duckdb", database=str(db_path), table="prices")
+        )
+        batch = next(iter(connector.read_batches(State())))
+
+        assert batch.metadata["column_types"] == {
+            "id": "int32",
+            "amount": "decimal128(10, 2)",
+        }
+
+        connector.close()
+
+    def test_duckdb_read_missing_table_raises(self, source_config: SourceConfig):
+        """Test that reading a missing table raises ConnectorError."""
+        source_config.table = "missing"
+        connector = DuckDBConnector(source_config)
+
+        with pytest.raises(ConnectorError) as exc_info:
+            list(connector.read_batches(State()))
+
+        assert "Table does not exist" in str(exc_info.value)
+        connector.close()
+
+
 class TestDuckDBConnectorRegistration:
     """Tests for DuckDBConnector registration."""
 
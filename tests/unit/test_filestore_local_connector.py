@@ -1,17 +1,33 @@
 """Unit tests for FileStoreConnector with local backend."""
 
 import csv
+import gzip
+import io
 import json
+import math
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from pydantic import TypeAdapter, ValidationError
 
-from dataloader.connectors.filestore.config import LocalFileStoreConfig
+from dataloader.connectors.filestore.config import (
+    FileStoreConfigType,
+    LocalFileStoreConfig,
+    S3FileStoreConfig,
+)
 from dataloader.connectors.filestore.connector import (
     FileStoreConnector,
     create_filestore_connector,
 )
+from dataloader.connectors.filestore.formats import get_format
 from dataloader.core.batch import ArrowBatch
 from dataloader.core.exceptions import ConnectorError
 from dataloader.core.state import State
@@ -49,6 +65,14 @@ class TestFileStoreLocalConnector:
             },
         )
 
+    def test_importing_dataloader_does_not_import_fsspec(self):
+        """Test that fsspec is only imported once a filesystem is needed."""
+        code = "import sys, dataloader; print('fsspec' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
     def test_filestore_connector_initialization(
         self, local_config: LocalFileStoreConfig
     ):
@@ -63,6 +87,24 @@ class TestFileStoreLocalConnector:
         assert connector._encoding == "utf-8"
         assert connector._filesystem is None
 
+    def test_filestore_connectors_share_filesystem(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that connectors with the same storage options reuse one filesystem."""
+        first = FileStoreConnector(local_config)
+        second = FileStoreConnector(local_config)
+
+        assert first._get_filesystem() is second._get_filesystem()
+
+    def test_filestore_connectors_share_format_handler(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that built-in format handlers are built once per format."""
+        first = FileStoreConnector(local_config)
+        second = FileStoreConnector(local_config)
+        assert first._format_handler is second._format_handler
+        assert get_format("csv", delimiter=";") is not first._format_handler
+
     def test_filestore_write_csv_append(
         self, local_config: LocalFileStoreConfig, sample_batch: ArrowBatch
     ):
@@ -89,6 +131,61 @@ class TestFileStoreLocalConnector:
         assert rows[0]["name"] == "Alice"
         assert rows[0]["score"] == "95.5"
 
+    def test_filestore_written_files_snapshot(
+        self, local_config: LocalFileStoreConfig, sample_batch: ArrowBatch
+    ):
+        """Test that written_files is reused until another file is written."""
+        connector = FileStoreConnector(local_config)
+        connector.write_batch(sample_batch, State())
+
+        first = connector.written_files
+        assert connector.written_files is first
+
+        connector.write_batch(sample_batch, State())
+        second = connector.written_files
+        assert len(first) == 1
+        assert len(second) == 2
+        assert second[0] == first[0]
+
+    def test_filestore_concurrent_writes(
+        self, local_config: LocalFileStoreConfig, sample_batch: ArrowBatch
+    ):
+        """Test that write_batch can be called from several threads at once."""
+        existing_file = Path(local_config.path) / "existing.csv"
+        existing_file.write_text("id,name\n1,Old")
+
+        local_config.write_mode = "overwrite"
+        connector = FileStoreConnector(local_config)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(
+                pool.map(
+                    lambda _: connector.write_batch(sample_batch, State()), range(8)
+                )
+            )
+
+        written_files = connector.written_files
+        assert len(set(written_files)) == 8
+        assert not existing_file.exists()
+        for file_url in written_files:
+            assert Path(file_url.replace("file://", "")).exists()
+
+    def test_filestore_write_url_matches_build_file_url(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that the reused write URL prefix gives the same URLs as before."""
+        connector = FileStoreConnector(local_config)
+        for name in ("data_1.csv", "data_2.csv"):
+            assert connector._build_write_url(name) == connector._build_file_url(name)
+
+        single_file = str(Path(local_config.path) / "out.csv")
+        connector = FileStoreConnector(
+            LocalFileStoreConfig(
+                type="filestore", backend="local", path=single_file, format="csv"
+            )
+        )
+        assert connector._build_write_url("data_1.csv") == f"file://{single_file}"
+
     def test_filestore_write_csv_overwrite(
         self, local_config: LocalFileStoreConfig, sample_batch: ArrowBatch, simple_batch
     ):
@@ -140,6 +237,71 @@ class TestFileStoreLocalConnector:
         # Existing file should be deleted
         assert not existing_file.exists()
 
+    @pytest.mark.parametrize("file_format", ["csv", "jsonl"])
+    def test_filestore_write_gzip_round_trip(
+        self, local_config: LocalFileStoreConfig, simple_batch, file_format: str
+    ):
+        """Test that gzip output is readable and replaced by a later overwrite."""
+        test_dir = Path(local_config.path)
+        local_config.format = file_format
+        local_config.compression = "gzip"
+        FileStoreConnector(local_config).write_batch(simple_batch, State())
+
+        written = list(test_dir.iterdir())
+        assert [path.name.endswith(f".{file_format}.gz") for path in written] == [True]
+        gzip.decompress(written[0].read_bytes())
+
+        batches = list(FileStoreConnector(local_config).read_batches(State()))
+        assert [batch.row_count for batch in batches] == [simple_batch.row_count]
+
+        stale = test_dir / f"stale.{file_format}.gz"
+        written[0].rename(stale)
+        local_config.write_mode = "overwrite"
+        FileStoreConnector(local_config).write_batch(simple_batch, State())
+        assert not stale.exists()
+
+    def test_filestore_compression_rejects_parquet(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that gzip compression is refused for Parquet output."""
+        local_config.format = "parquet"
+        local_config.compression = "gzip"
+
+        with pytest.raises(ConnectorError, match="Parquet"):
+            FileStoreConnector(local_config)
+
+    def test_filestore_overwrite_deletes_existing_files_in_one_call(
+        self, local_config: LocalFileStoreConfig, monkeypatch
+    ):
+        """Test that overwrite mode removes all matching files with a single rm."""
+        test_dir = Path(local_config.path)
+        existing_files = [test_dir / f"old_{i}.csv" for i in range(3)]
+        for existing_file in existing_files:
+            existing_file.write_text("id,name\n1,Old")
+
+        local_config.write_mode = "overwrite"
+        connector = FileStoreConnector(local_config)
+        fs = connector._get_filesystem()
+        rm_calls = []
+        original_rm = fs.rm
+
+        def recording_rm(path, *args, **kwargs):
+            rm_calls.append(path)
+            return original_rm(path, *args, **kwargs)
+
+        monkeypatch.setattr(fs, "rm", recording_rm)
+
+        batch = ArrowBatch.from_rows(columns=["id", "name"], rows=[[2, "New"]])
+        connector.write_batch(batch, State())
+
+        assert len(rm_calls) == 1
+        assert sorted(Path(p).name for p in rm_calls[0]) == [
+            "old_0.csv",
+            "old_1.csv",
+            "old_2.csv",
+        ]
+        assert not any(f.exists() for f in existing_files)
+
     def test_filestore_full_refresh_deletes_entire_path(
         self, local_config: LocalFileStoreConfig
     ):
@@ -324,6 +486,272 @@ class TestFileStoreLocalConnector:
         total_rows = sum(len(batch.rows) for batch in batches)
         assert total_rows >= 4
 
+    def test_filestore_read_through_file_cache(self, tmp_path: Path):
+        """Test that remote reads go through the local cache when cache_dir is set."""
+        import fsspec
+
+        memory_fs = fsspec.filesystem("memory")
+        memory_fs.pipe("/cache_test/data.csv", b"id,name\n1,Alice\n")
+        cache_dir = tmp_path / "cache"
+
+        try:
+            config = SourceConfig(
+                type="filestore",
+                backend="memory",
+                filepath="memory://cache_test/data.csv",
+                format="csv",
+                cache_dir=str(cache_dir),
+            )
+            connector = FileStoreConnector(config)
+
+            batches = list(connector.read_batches(State()))
+
+            assert batches[0].rows == [["1", "Alice"]]
+            assert connector._get_read_filesystem() is not connector._get_filesystem()
+            assert any(path.is_file() for path in cache_dir.iterdir())
+        finally:
+            memory_fs.rm("/cache_test", recursive=True)
+
+    def test_filestore_file_cache_expiry_skips_remote_check(self, tmp_path: Path):
+        """Test that cached files are trusted without a remote check until expiry."""
+        import fsspec
+
+        memory_fs = fsspec.filesystem("memory")
+        memory_fs.pipe("/cache_expiry_test/data.csv", b"id,name\n1,Alice\n")
+
+        try:
+            config = SourceConfig(
+                type="filestore",
+                backend="memory",
+                filepath="memory://cache_expiry_test/data.csv",
+                format="csv",
+                cache_dir=str(tmp_path / "cache"),
+                cache_expiry=3600,
+            )
+            connector = FileStoreConnector(config)
+            assert list(connector.read_batches(State()))[0].rows == [["1", "Alice"]]
+
+            memory_fs.pipe("/cache_expiry_test/data.csv", b"id,name\n2,Bob\n")
+            assert list(connector.read_batches(State()))[0].rows == [["1", "Alice"]]
+        finally:
+            memory_fs.rm("/cache_expiry_test", recursive=True)
+
+    def test_filestore_list_single_file_skips_directory_probe(
+        self, local_config: LocalFileStoreConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a path with a format extension is listed without fs.isdir."""
+        test_file = Path(local_config.path) / "data.csv"
+        test_file.write_text("id,name\n1,Alice\n", encoding="utf-8")
+
+        local_config.path = str(test_file)
+        connector = FileStoreConnector(local_config)
+        monkeypatch.setattr(
+            connector._get_filesystem(),
+            "isdir",
+            lambda path: pytest.fail("fs.isdir was called"),
+        )
+
+        files = connector._list_files()
+
+        assert [file_info["name"] for file_info in files] == ["data.csv"]
+
+    def test_filestore_local_prefetch_reads_files_in_order(
+        self, local_config: LocalFileStoreConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that local read-ahead is opt-in and keeps files in path order."""
+        test_dir = Path(local_config.path)
+        for i in range(5):
+            (test_dir / f"part_{i}.csv").write_text(
+                f"id,name\n{i},User{i}\n", encoding="utf-8"
+            )
+        prefetched = []
+        original = FileStoreConnector._read_file_bytes
+
+        def record_read(fs, file_path):
+            prefetched.append(file_path)
+            return original(fs, file_path)
+
+        monkeypatch.setattr(
+            FileStoreConnector, "_read_file_bytes", staticmethod(record_read)
+        )
+
+        batches = list(FileStoreConnector(local_config).read_batches(State()))
+        assert [batch.rows[0][1] for batch in batches] == [f"User{i}" for i in range(5)]
+        assert prefetched == []
+
+        local_config.prefetch_files = 2
+        batches = list(FileStoreConnector(local_config).read_batches(State()))
+
+        assert [batch.rows[0][1] for batch in batches] == [f"User{i}" for i in range(5)]
+        assert len(prefetched) == 5
+
+    def test_filestore_read_streams_batches(self, local_config: LocalFileStoreConfig):
+        """Test that CSV, JSONL and Parquet files are read in batch-sized chunks."""
+        test_dir = Path(local_config.path)
+        with open(test_dir / "data.csv", "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "name"])
+            writer.writerows([[i, f"User{i}"] for i in range(5)])
+        with open(test_dir / "data.jsonl", "w", encoding="utf-8") as f:
+            for i in range(5):
+                f.write(json.dumps({"id": i, "name": f"User{i}"}) + "\n")
+        pq.write_table(
+            pa.table({"id": list(range(5)), "name": [f"User{i}" for i in range(5)]}),
+            test_dir / "data.parquet",
+        )
+
+        for file_format in ("csv", "jsonl", "parquet"):
+            local_config.format = file_format
+            connector = FileStoreConnector(local_config)
+            connector._batch_size = 2
+
+            batches = list(connector.read_batches(State()))
+
+            assert [batch.row_count for batch in batches] == [2, 2, 1]
+            assert [batch.metadata["batch_number"] for batch in batches] == [1, 2, 3]
+            assert batches[2].rows[0][1] == "User4"
+
+    def test_filestore_read_csv_quoted_values_stay_strings(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that quoted delimiters and newlines parse and values stay strings."""
+        test_dir = Path(local_config.path)
+        (test_dir / "data.csv").write_bytes(b'id,note\n1,"a, b"\n2,"two\nlines"\n3,\n')
+
+        connector = FileStoreConnector(local_config)
+        batches = list(connector.read_batches(State()))
+
+        assert len(batches) == 1
+        assert batches[0].rows == [["1", "a, b"], ["2", "two\nlines"], ["3", ""]]
+        assert batches[0].metadata["column_types"]["id"] == "int"
+
+    @pytest.mark.parametrize("arrow_csv", [True, False])
+    def test_filestore_read_csv_infers_column_types(
+        self,
+        local_config: LocalFileStoreConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        arrow_csv: bool,
+    ):
+        """Test that Arrow and csv-module reads infer the same column types."""
+        monkeypatch.setattr(
+            "dataloader.connectors.filestore.formats._ARROW_CSV_STRINGS", arrow_csv
+        )
+        test_dir = Path(local_config.path)
+        (test_dir / "data.csv").write_bytes(
+            b"id,score,day,name\n"
+            b"1,1.5,2024-01-01,Alice\n"
+            b"2,2.5,2024-01-02,Bob\n"
+            b"3,x,2024-01-03T10:00:00,42\n"
+        )
+
+        batches = list(FileStoreConnector(local_config).read_batches(State()))
+
+        assert batches[0].metadata["column_types"] == {
+            "id": "int",
+            "score": "float",
+            "day": "datetime",
+            "name": "string",
+        }
+
+    def test_csv_format_reads_str_and_bytes_content(self):
+        """Test that CSV content given as str or bytes parses the same way."""
+        csv_format = get_format("csv")
+        text = "id,name\n1,Zoë\n2,Bob\n3,Ann\n"
+
+        for content in (text, text.encode("utf-8")):
+            batches = list(csv_format.read_batches(content, "data.csv", batch_size=2))
+
+            assert [batch.row_count for batch in batches] == [2, 1]
+            assert batches[0].rows == [["1", "Zoë"], ["2", "Bob"]]
+
+    def test_parquet_format_reads_bytes_content(self):
+        """Test that Parquet bytes are read in batch-sized record batches."""
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]}), sink)
+
+        batches = list(
+            get_format("parquet").read_batches(
+                sink.getvalue().to_pybytes(), "data.parquet", batch_size=2
+            )
+        )
+
+        assert [batch.row_count for batch in batches] == [2, 1]
+        assert batches[1].rows == [[3, "c"]]
+        assert batches[0].metadata["column_types"] == {"id": "int64", "name": "string"}
+
+    def test_filestore_read_parquet_columns_and_filters(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that Parquet reads project columns and filter rows."""
+        pq.write_table(
+            pa.table({"id": list(range(100)), "name": [f"u{i}" for i in range(100)]}),
+            Path(local_config.path) / "data.parquet",
+            row_group_size=10,
+        )
+        local_config.format = "parquet"
+        local_config.columns = ["name"]
+        local_config.filters = [["id", ">=", 85], ["id", "!=", 90]]
+        connector = FileStoreConnector(local_config)
+        connector._batch_size = 4
+
+        batches = list(connector.read_batches(State()))
+
+        assert [batch.row_count for batch in batches] == [4, 4, 4, 2]
+        assert batches[0].columns == ["name"]
+        assert [row[0] for batch in batches for row in batch.rows] == [
+            f"u{i}" for i in range(85, 100) if i != 90
+        ]
+
+    def test_filestore_read_filters_rejects_non_parquet(
+        self, local_config: LocalFileStoreConfig
+    ):
+        """Test that row filters are refused for formats that cannot apply them."""
+        local_config.filters = [["id", ">", 1]]
+
+        with pytest.raises(ConnectorError, match="Parquet"):
+            FileStoreConnector(local_config)
+
+    def test_csv_format_arrow_writer_matches_csv_module(self):
+        """Test that Arrow-written CSV is byte-identical to csv.writer output."""
+        columns = ["id", "name", "active", "day"]
+        csv_format = get_format("csv")
+
+        # Plain names go through Arrow's writer; names needing quotes fall back
+        for name in ("Ann", 'a, "b"\nc'):
+            rows = [[1, name, True, date(2024, 1, 1)], [2, None, None, None]]
+            expected = io.StringIO(newline="")
+            writer = csv.writer(expected)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+            written = csv_format.write_batch(ArrowBatch.from_rows(columns, rows))
+
+            assert written == expected.getvalue().encode()
+
+    def test_csv_format_single_column_empty_values_match_csv_module(self):
+        """Test that a lone empty field is quoted like csv.writer quotes it."""
+        arrow_batch = ArrowBatch.from_rows(["name"], [["a"], [""], [None]])
+
+        assert (
+            get_format("csv").write_batch(arrow_batch) == b'name\r\na\r\n""\r\n""\r\n'
+        )
+
+    def test_parquet_format_write_options(self, sample_batch: ArrowBatch):
+        """Test that Parquet output defaults to zstd with statistics and can be tuned."""
+        default = pq.ParquetFile(
+            io.BytesIO(get_format("parquet").write_batch(sample_batch))
+        )
+        column = default.metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+        assert column.statistics.has_min_max
+
+        snappy = pq.ParquetFile(
+            io.BytesIO(
+                get_format("parquet", compression="snappy").write_batch(sample_batch)
+            )
+        )
+        assert snappy.metadata.row_group(0).column(0).compression == "SNAPPY"
+
     def test_filestore_read_json(self, local_config: LocalFileStoreConfig):
         """Test reading JSON files."""
         test_dir = Path(local_config.path)
@@ -369,6 +797,55 @@ class TestFileStoreLocalConnector:
         batch = batches[0]
         assert len(batch.rows) >= 2
 
+    def test_jsonl_format_columns_follow_first_object(self):
+        """Test that JSONL columns come from the first object, with nulls for gaps."""
+        content = b'{"id": 1, "name": "Alice"}\n\n{"id": 2, "extra": true}\n'
+
+        batches = list(get_format("jsonl").read_batches(content, "data.jsonl"))
+
+        assert batches[0].columns == ["id", "name"]
+        assert batches[0].rows == [[1, "Alice"], [2, None]]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("file_format", ["json", "jsonl"])
+    def test_json_formats_round_trip_with_and_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool, file_format: str
+    ):
+        """Test that JSON handling is the same whichever parser is available."""
+        if not use_orjson:
+            monkeypatch.setattr("dataloader.connectors.filestore.formats.orjson", None)
+        json_format = get_format(file_format)
+        batch = ArrowBatch.from_rows(
+            columns=["id", "name", "score"],
+            rows=[[1, "Zoë", 1.5], [2, "Bob", None]],
+        )
+
+        content = json_format.write_batch(batch)
+        batches = list(json_format.read_batches(content, f"data.{file_format}"))
+
+        assert batches[0].rows == [[1, "Zoë", 1.5], [2, "Bob", None]]
+        # json accepts NaN literals, so they are read whichever parser is used
+        nan_content = b'[{"x": NaN}]' if file_format == "json" else b'{"x": NaN}\n'
+        (nan_batch,) = json_format.read_batches(nan_content, f"data.{file_format}")
+        assert math.isnan(nan_batch.rows[0][0])
+
+    @pytest.mark.parametrize("file_format", ["json", "jsonl"])
+    def test_json_formats_write_arrow_and_row_batches_alike(self, file_format: str):
+        """Test that Arrow-backed and plain row batches serialize identically."""
+
+        class RowBatch:
+            columns = ["id", "name"]
+            rows = [[1, "Alice"], [2, None]]
+            metadata: dict = {}
+            row_count = 2
+
+        json_format = get_format(file_format)
+        arrow_batch = ArrowBatch.from_rows(RowBatch.columns, RowBatch.rows)
+
+        assert json_format.write_batch(arrow_batch) == json_format.write_batch(
+            RowBatch()
+        )
+
     def test_filestore_read_incremental_filtering(
         self, local_config: LocalFileStoreConfig
     ):
@@ -410,6 +887,40 @@ class TestFileStoreLocalConnector:
         # The important thing is that filtering is attempted
         assert total_rows2 >= 0  # At least no errors
 
+    def test_filestore_modified_filter_uses_listing_details(
+        self, local_config: LocalFileStoreConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that last_modified filtering reuses listing mtimes (no per-file stat)."""
+        test_dir = Path(local_config.path)
+        old_file = test_dir / "a_data.csv"
+        new_file = test_dir / "b_data.csv"
+        for path in (old_file, new_file):
+            path.write_text("id,name\n1,Alice\n", encoding="utf-8")
+        os.utime(old_file, (1_000_000_000, 1_000_000_000))
+        os.utime(new_file, (2_000_000_000, 2_000_000_000))
+
+        connector = FileStoreConnector(local_config)
+        fs = connector._get_filesystem()
+        monkeypatch.setattr(
+            fs, "modified", lambda path: pytest.fail("fs.modified was called")
+        )
+
+        cursor = datetime.fromtimestamp(1_500_000_000, tz=timezone.utc).isoformat()
+        state = State(cursor_values={"last_modified": cursor})
+        files = connector._filter_files_by_state(connector._list_files(), state)
+
+        assert [file_info["name"] for file_info in files] == ["b_data.csv"]
+
+    def test_filestore_modified_from_remote_listing_details(self):
+        """Test that S3, Azure and GCS listing timestamps are recognized."""
+        expected = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        modified = FileStoreConnector._modified_from_info
+
+        assert modified({"LastModified": expected}) == expected
+        assert modified({"last_modified": expected}) == expected
+        assert modified({"updated": "2024-01-02T03:04:05Z"}) == expected
+        assert modified({"size": 1}) is None
+
     def test_filestore_empty_batch(self, local_config: LocalFileStoreConfig):
         """Test that empty batch doesn't create a file."""
         connector = FileStoreConnector(local_config)
@@ -437,6 +948,24 @@ class TestFileStoreLocalConnector:
 
         assert "Merge write mode is not supported" in str(exc_info.value)
 
+    def test_filestore_config_type_dispatches_on_backend(self, tmp_path: Path):
+        """Test that FileStoreConfigType validates to the model named by backend."""
+        adapter = TypeAdapter(FileStoreConfigType)
+
+        local = adapter.validate_python(
+            {"type": "filestore", "backend": "local", "path": str(tmp_path)}
+        )
+        s3 = adapter.validate_python(
+            {"type": "filestore", "backend": "s3", "bucket": "b", "path": "data/"}
+        )
+
+        assert isinstance(local, LocalFileStoreConfig)
+        assert isinstance(s3, S3FileStoreConfig)
+        with pytest.raises(ValidationError):
+            adapter.validate_python(
+                {"type": "filestore", "backend": "ftp", "path": "x"}
+            )
+
     def test_filestore_with_source_config(self, tmp_path: Path):
         """Test FileStoreConnector with SourceConfig."""
         test_dir = tmp_path / "test_data"
@@ -6,6 +6,7 @@ directly (which works with moto) instead of s3fs's async implementation.
 """
 
 import csv
+import io
 import json
 from datetime import datetime
 
@@ -53,7 +54,7 @@ def mock_s3_filesystem(s3_bucket, monkeypatch):
             mock_fs.protocol = "s3"
 
             # Mock the methods we use
-            def mock_open(path, mode="rb", encoding=None):
+            def mock_open(path, mode="rb", encoding=None, **kwargs):
                 class MockFile:
                     def __init__(self, path, mode, encoding):
                         self.path = path
@@ -71,6 +72,9 @@ def mock_s3_filesystem(s3_bucket, monkeypatch):
                                     Bucket="test-bucket", Key=s3_key
                                 )
                                 self._content = response["Body"].read()
+                                if "b" in self.mode:
+                                    # Behave like a real binary file object
+                                    return io.BytesIO(self._content)
                                 if self.encoding:
                                     self._content = self._content.decode(self.encoding)
                             except s3_bucket.exceptions.NoSuchKey:
@@ -121,19 +125,42 @@ def mock_s3_filesystem(s3_bucket, monkeypatch):
                 )
                 return "Contents" in objects
 
-            def mock_find(path):
+            def mock_find(path, detail=False):
                 # List all files with the given prefix
                 prefix = path.replace("s3://test-bucket/", "").rstrip("/") + "/"
                 objects = s3_bucket.list_objects_v2(Bucket="test-bucket", Prefix=prefix)
-                files = []
+                files = {}
                 for obj in objects.get("Contents", []):
-                    files.append(f"s3://test-bucket/{obj['Key']}")
-                return files
+                    files[f"s3://test-bucket/{obj['Key']}"] = {
+                        "name": f"test-bucket/{obj['Key']}",
+                        "size": obj["Size"],
+                        "type": "file",
+                        "LastModified": obj["LastModified"],
+                    }
+                return files if detail else list(files)
+
+            def mock_cat_file(path, start=None, end=None):
+                # Read a whole object, or the byte range [start, end)
+                s3_key = path.replace("s3://test-bucket/", "")
+                kwargs = {}
+                if start is not None:
+                    kwargs["Range"] = f"bytes={start}-{'' if end is None else end - 1}"
+                response = s3_bucket.get_object(
+                    Bucket="test-bucket", Key=s3_key, **kwargs
+                )
+                return response["Body"].read()
 
-            def mock_rm(path):
-                # Delete file from S3
+            def mock_pipe_file(path, value, **kwargs):
+                # Write bytes to S3 in a single put
                 s3_key = path.replace("s3://test-bucket/", "")
-                s3_bucket.delete_object(Bucket="test-bucket", Key=s3_key)
+                s3_bucket.put_object(Bucket="test-bucket", Key=s3_key, Body=value)
+
+            def mock_rm(path, recursive=False):
+                # Delete file(s) from S3; fsspec's rm accepts a path or a list
+                paths = path if isinstance(path, list) else [path]
+                for p in paths:
+                    s3_key = p.replace("s3://test-bucket/", "")
+                    s3_bucket.delete_object(Bucket="test-bucket", Key=s3_key)
 
             def mock_exists(path):
                 # Check if file exists in S3
@@ -147,6 +174,8 @@ def mock_s3_filesystem(s3_bucket, monkeypatch):
             mock_fs.open = mock_open
             mock_fs.isdir = mock_isdir
             mock_fs.find = mock_find
+            mock_fs.cat_file = mock_cat_file
+            mock_fs.pipe_file = mock_pipe_file
             mock_fs.rm = mock_rm
             mock_fs.exists = mock_exists
             mock_fs.modified = MagicMock(return_value="2024-01-01T00:00:00")
@@ -371,6 +400,66 @@ class TestFileStoreS3Connector:
         total_rows = sum(len(batch.rows) for batch in batches)
         assert total_rows >= 4
 
+    @pytest.mark.parametrize("prefetch_files", [None, 0, 2])
+    def test_filestore_s3_read_prefetches_files_in_order(
+        self,
+        s3_config: S3FileStoreConfig,
+        s3_bucket,
+        mock_s3_filesystem,
+        prefetch_files,
+    ):
+        """Test that S3 files are yielded in path order for any prefetch window."""
+        for i in range(7):
+            s3_bucket.put_object(
+                Bucket="test-bucket",
+                Key=f"data/file_{i}.csv",
+                Body=f"id,name\n{i},User{i}\n".encode("utf-8"),
+            )
+
+        s3_config.prefetch_files = prefetch_files
+        connector = FileStoreConnector(s3_config)
+        batches = list(connector.read_batches(State()))
+
+        assert [batch.metadata["file_path"] for batch in batches] == [
+            f"s3://test-bucket/data/file_{i}.csv" for i in range(7)
+        ]
+        assert [batch.rows[0] for batch in batches] == [
+            [str(i), f"User{i}"] for i in range(7)
+        ]
+
+    def test_filestore_s3_read_large_file_in_ranges(
+        self, s3_config: S3FileStoreConfig, s3_bucket, mock_s3_filesystem, monkeypatch
+    ):
+        """Test that large S3 files are downloaded as parallel byte ranges."""
+        from dataloader.connectors.filestore import connector as connector_module
+
+        monkeypatch.setattr(connector_module, "RANGE_MIN_FILE_SIZE", 64)
+        monkeypatch.setattr(connector_module, "RANGE_CHUNK_SIZE", 50)
+        monkeypatch.setattr(connector_module, "PREFETCH_MAX_FILE_SIZE", 32)
+
+        rows = [[str(i), f"User{i}"] for i in range(40)]
+        body = "id,name\n" + "".join(f"{i},{name}\n" for i, name in rows)
+        s3_bucket.put_object(
+            Bucket="test-bucket", Key="data/big.csv", Body=body.encode("utf-8")
+        )
+
+        connector = FileStoreConnector(s3_config)
+        ranges = []
+        fs = connector._get_filesystem()
+        original_cat_file = fs.cat_file
+
+        def recording_cat_file(path, start=None, end=None):
+            ranges.append((start, end))
+            return original_cat_file(path, start=start, end=end)
+
+        fs.cat_file = recording_cat_file
+
+        batches = list(connector.read_batches(State()))
+
+        assert [row for batch in batches for row in batch.rows] == rows
+        assert len(ranges) == -(-len(body) // 50)
+        assert ranges[0] == (0, 50)
+
     def test_filestore_s3_read_json(
         self, s3_config: S3FileStoreConfig, s3_bucket, mock_s3_filesystem
     ):
@@ -545,6 +634,13 @@ class TestFileStoreS3Connector:
         assert connector._storage_options["secret"] == "test-secret"
         assert "client_kwargs" in connector._storage_options
         assert connector._storage_options["client_kwargs"]["region_name"] == "us-east-1"
+        assert connector._storage_options["default_block_size"] == 32 * 2**20
+        assert connector._open_options == {"block_size": 32 * 2**20}
+        assert connector._pipe_options == {"chunksize": 16 * 2**20}
+        assert connector._storage_options["default_cache_type"] == "readahead"
+        assert connector._storage_options["config_kwargs"] == {
+            "max_pool_connections": 64
+        }
 
     def test_filestore_s3_storage_options_without_credentials(
         self, s3_config: S3FileStoreConfig
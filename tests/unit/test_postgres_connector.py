@@ -56,7 +56,7 @@ class TestPostgresConnector:
         """Test that PostgresConnector initializes correctly."""
         connector = PostgresConnector(postgres_config)
 
-        assert connector._batch_size == PostgresConnector.DEFAULT_BATCH_SIZE
+        assert connector._batch_size is None
         assert connector._engine is None
 
     def test_postgres_connection_url_with_password(self, postgres_config: SourceConfig):
@@ -114,19 +114,15 @@ class TestPostgresConnector:
         assert "Failed to create database engine" in str(exc_info.value)
         assert exc_info.value.context["host"] == "localhost"
 
-    @patch("dataloader.connectors.postgres.connector.pd.read_sql")
     @patch("dataloader.connectors.postgres.connector.create_engine")
     @patch("dataloader.connectors.postgres.connector.inspect")
     def test_postgres_read_batches(
         self,
         mock_inspect: MagicMock,
         mock_create_engine: MagicMock,
-        mock_read_sql: MagicMock,
         postgres_config: SourceConfig,
     ):
         """Test reading batches from Postgres using SQLAlchemy."""
-        import pandas as pd
-
         # Setup mock engine
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
@@ -139,10 +135,13 @@ class TestPostgresConnector:
             {"name": "name", "type": "VARCHAR(100)"},
         ]
 
-        # Setup mock pandas DataFrame from read_sql
-        mock_df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
-        # Mock read_sql to return an iterator (chunksize behavior)
-        mock_read_sql.return_value = iter([mock_df])
+        # Setup mock streamed result
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_result = mock_conn.execution_options.return_value.execute.return_value
+        mock_result.keys.return_value = ["id", "name"]
+        mock_result.fetchmany.side_effect = [[(1, "Alice"), (2, "Bob")], []]
 
         connector = PostgresConnector(postgres_config)
         state = State()
@@ -154,8 +153,49 @@ class TestPostgresConnector:
         assert batches[0].rows == [[1, "Alice"], [2, "Bob"]]
         assert batches[0].metadata["source_type"] == "postgres"
         assert batches[0].metadata["table"] == "users"
+        # INTEGER is 4 bytes wide; VARCHAR is estimated at 32 bytes
+        mock_conn.execution_options.assert_called_once_with(yield_per=262144 // 36)
+        # The engine's pool is kept for later reads until the connector is closed
+        mock_engine.dispose.assert_not_called()
+        connector.close()
         mock_engine.dispose.assert_called_once()
 
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_postgres_read_batches_splits_fetched_rows(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        postgres_config: SourceConfig,
+    ):
+        """Test that each fetchmany chunk becomes one Arrow batch with typed nulls."""
+        import pyarrow as pa
+
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_inspect.return_value.get_columns.return_value = [
+            {"name": "id", "type": "INTEGER"},
+            {"name": "score", "type": "INTEGER"},
+        ]
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_result = mock_conn.execution_options.return_value.execute.return_value
+        mock_result.keys.return_value = ["id", "score"]
+        mock_result.fetchmany.side_effect = [[(1, 10), (2, None)], [(3, 30)], []]
+
+        connector = PostgresConnector(postgres_config)
+        connector._batch_size = 2
+
+        batches = list(connector.read_batches(State()))
+
+        assert [batch.row_count for batch in batches] == [2, 1]
+        assert [batch.metadata["batch_number"] for batch in batches] == [1, 2]
+        assert batches[0].rows == [[1, 10], [2, None]]
+        # Nulls stay nulls in an integer column instead of becoming NaN floats
+        assert batches[0].to_arrow().schema.field("score").type == pa.int64()
+        mock_result.fetchmany.assert_called_with(2)
+
     @patch("dataloader.connectors.postgres.connector.create_engine")
     @patch("dataloader.connectors.postgres.connector.inspect")
     def test_postgres_incremental_query(
@@ -193,6 +233,108 @@ class TestPostgresConnector:
         assert 'ORDER BY "updated_at"' in query
         assert params["cursor_value"] == "2024-01-01"
 
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    def test_postgres_engine_pool_options(
+        self, mock_create_engine: MagicMock, postgres_config: SourceConfig
+    ):
+        """Test that PgBouncer mode swaps pre-ping for connection recycling."""
+        PostgresConnector(postgres_config)._get_engine()
+        assert mock_create_engine.call_args.kwargs["pool_pre_ping"] is True
+        assert mock_create_engine.call_args.kwargs["pool_size"] == 4
+        assert "pool_recycle" not in mock_create_engine.call_args.kwargs
+
+        postgres_config.pgbouncer = True
+        PostgresConnector(postgres_config)._get_engine()
+        assert mock_create_engine.call_args.kwargs["pool_pre_ping"] is False
+        assert mock_create_engine.call_args.kwargs["pool_recycle"] == 60
+
+    def test_postgres_rows_per_batch(self, postgres_config: SourceConfig):
+        """Test that read batch size follows the schema width unless configured."""
+        import pyarrow as pa
+
+        connector = PostgresConnector(postgres_config)
+
+        narrow = [("id", pa.int16())]
+        wide = [(f"c{i}", pa.string()) for i in range(100)]
+        assert connector._rows_per_batch(narrow) == PostgresConnector.MAX_BATCH_SIZE
+        assert connector._rows_per_batch(wide) == PostgresConnector.MIN_BATCH_SIZE
+        assert connector._rows_per_batch([("a", pa.float64())] * 4) == 8192
+
+        postgres_config.batch_size = 500
+        assert PostgresConnector(postgres_config)._rows_per_batch(wide) == 500
+
+    def test_postgres_insert_batch_uses_copy(self, postgres_config: SourceConfig):
+        """Test that batches are loaded with COPY from Arrow-rendered CSV."""
+        connector = PostgresConnector(postgres_config)
+        batch = ArrowBatch.from_rows(
+            columns=["id", "name"],
+            rows=[[1, "Alice"], [2, ""], [3, None]],
+        )
+        mock_conn = MagicMock()
+        cursor = mock_conn.connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, stream: copied.append(
+            stream.read()
+        )
+
+        connector._insert_batch(mock_conn, batch)
+
+        sql = cursor.copy_expert.call_args[0][0]
+        assert sql == (
+            'COPY "public"."users" ("id", "name") FROM STDIN WITH (FORMAT csv)'
+        )
+        # Empty strings are quoted; nulls are bare empty fields
+        assert copied == [b'1,"Alice"\n2,""\n3,\n']
+
+    def test_postgres_insert_batch_hex_encodes_binary(
+        self, postgres_config: SourceConfig
+    ):
+        """Test that binary values are copied in bytea hex format, not raw."""
+        import pyarrow as pa
+
+        connector = PostgresConnector(postgres_config)
+        batch = ArrowBatch(
+            pa.table(
+                {
+                    "id": [1, 2, 3],
+                    "data": pa.array([b"\x00\n\xff", b"", None], pa.large_binary()),
+                }
+            )
+        )
+        mock_conn = MagicMock()
+        cursor = mock_conn.connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, stream: copied.append(
+            stream.read()
+        )
+
+        connector._insert_batch(mock_conn, batch)
+
+        assert copied == [b'1,"\\x000aff"\n2,"\\x"\n3,\n']
+
+    @patch("dataloader.connectors.postgres.connector.pd.DataFrame.to_sql")
+    def test_postgres_insert_batch_falls_back_for_nested_types(
+        self, mock_to_sql: MagicMock, postgres_config: SourceConfig
+    ):
+        """Test that types Arrow cannot write as CSV are inserted via pandas."""
+        connector = PostgresConnector(postgres_config)
+        batch = ArrowBatch.from_rows(columns=["tags"], rows=[[["a", "b"]]])
+        mock_conn = MagicMock()
+
+        connector._insert_batch(mock_conn, batch)
+
+        mock_conn.connection.cursor.assert_not_called()
+        assert mock_to_sql.call_args[0][:2] == ("users", mock_conn)
+
+    @patch("dataloader.connectors.postgres.connector.pd", None)
+    def test_postgres_connector_without_pandas(self, postgres_config: SourceConfig):
+        """Test that pandas is only required for nested-type writes."""
+        connector = PostgresConnector(postgres_config)
+        batch = ArrowBatch.from_rows(columns=["tags"], rows=[[["a", "b"]]])
+
+        with pytest.raises(ConnectorError, match="requires pandas"):
+            connector._insert_batch(MagicMock(), batch)
+
     def test_create_postgres_connector_factory(self, postgres_config: SourceConfig):
         """Test the factory function creates PostgresConnector."""
         connector = create_postgres_connector(postgres_config)
@@ -457,3 +599,324 @@ class TestPostgresConnectorFullRefresh:
         assert (
             mock_insert_batch.call_count == 2
         ), "Insert should be called for each batch"
+
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_append_caches_existing_columns(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that append mode looks up table columns once and tracks ALTERs."""
+        from sqlalchemy.engine import Engine
+
+        destination_config.write_mode = "append"
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+
+        mock_inspector = MagicMock()
+        mock_inspect.return_value = mock_inspector
+        mock_inspector.get_columns.return_value = [{"name": "id"}, {"name": "name"}]
+
+        connector = PostgresConnector(destination_config)
+        state = State()
+        wider_batch = ArrowBatch.from_rows(
+            columns=["id", "name", "email", "age"],
+            rows=[[3, "Charlie", "c@example.com", 30]],
+            metadata={},
+        )
+
+        connector.write_batch(sample_batch, state)
+        connector.write_batch(wider_batch, state)
+        connector.write_batch(wider_batch, state)
+
+        alter_calls = [
+            execute_call
+            for execute_call in mock_conn.execute.call_args_list
+            if "ALTER TABLE" in str(execute_call[0][0])
+        ]
+        assert mock_inspector.get_columns.call_count == 1
+        # Both new columns are added by a single statement
+        assert len(alter_calls) == 1
+        assert str(alter_calls[0][0][0]) == (
+            'ALTER TABLE "public"."users" '
+            'ADD COLUMN "email" VARCHAR, ADD COLUMN "age" BIGINT'
+        )
+        assert mock_insert_batch.call_count == 3
+
+    @patch(
+        "dataloader.connectors.postgres.connector.PostgresConnector._add_missing_columns"
+    )
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_append_skips_schema_checks_for_unchanged_schema(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        mock_add_missing_columns: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that schema evolution only runs when the batch schema changes."""
+        from sqlalchemy.engine import Engine
+
+        destination_config.write_mode = "append"
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_inspect.return_value.get_columns.return_value = [
+            {"name": "id"},
+            {"name": "name"},
+        ]
+
+        connector = PostgresConnector(destination_config)
+        state = State()
+        wider_batch = ArrowBatch.from_rows(
+            columns=["id", "name", "email"],
+            rows=[[3, "Charlie", "c@example.com"]],
+            metadata={},
+        )
+
+        connector.write_batch(sample_batch, state)
+        connector.write_batch(sample_batch, state)
+        assert mock_add_missing_columns.call_count == 1
+
+        connector.write_batch(wider_batch, state)
+        connector.write_batch(wider_batch, state)
+        assert mock_add_missing_columns.call_count == 2
+        assert mock_insert_batch.call_count == 4
+
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    def test_concurrent_writes_prepare_table_once(
+        self,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that concurrent write_batch calls set up the table only once."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from sqlalchemy.engine import Engine
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+
+        connector = PostgresConnector(destination_config)
+
+        def handle_write_mode(conn: Any, batch: ArrowBatch, full_refresh: bool):
+            time.sleep(0.05)
+            connector._table_created = True
+
+        state = State()
+        with patch.object(
+            connector, "_handle_write_mode", side_effect=handle_write_mode
+        ) as mock_handle_write_mode:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        lambda _: connector.write_batch(sample_batch, state), range(8)
+                    )
+                )
+
+        assert mock_handle_write_mode.call_count == 1
+        assert mock_insert_batch.call_count == 8
+        mock_create_engine.assert_called_once()
+
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_sequential_writes_reuse_connection(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that one connection is held across batches and released on failure."""
+        from sqlalchemy.engine import Engine
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_exit = MagicMock(return_value=False)
+        mock_engine.connect.return_value.__exit__ = mock_exit
+        mock_inspect.return_value.get_columns.return_value = []
+
+        connector = PostgresConnector(destination_config)
+        state = State()
+
+        for _ in range(3):
+            connector.write_batch(sample_batch, state)
+
+        # Each batch is still committed, but on the same connection
+        assert mock_engine.connect.call_count == 1
+        assert mock_conn.commit.call_count == 4  # table setup + 3 batches
+        mock_exit.assert_not_called()
+
+        mock_insert_batch.side_effect = ConnectorError("Failed to insert batch")
+        with pytest.raises(ConnectorError):
+            connector.write_batch(sample_batch, state)
+        mock_exit.assert_called_once()
+
+        mock_insert_batch.side_effect = None
+        connector.write_batch(sample_batch, state)
+        assert mock_engine.connect.call_count == 2
+
+        connector.close()
+        assert mock_exit.call_count == 2
+        mock_engine.dispose.assert_called_once()
+
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_append_skips_catalog_after_creating_table(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that a table created by this connector is never re-inspected."""
+        from sqlalchemy.engine import Engine
+
+        destination_config.write_mode = "append"
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_inspect.return_value.get_columns.return_value = []
+
+        connector = PostgresConnector(destination_config)
+        state = State()
+        wider_batch = ArrowBatch.from_rows(
+            columns=["id", "name", "email"],
+            rows=[[3, "Charlie", "c@example.com"]],
+            metadata={},
+        )
+
+        connector.write_batch(sample_batch, state)
+        connector.write_batch(wider_batch, state)
+
+        # Only the cold-start existence check hits the catalog; the new column
+        # is found missing from the columns the connector created
+        assert mock_inspect.return_value.get_columns.call_count == 1
+        statements = [str(c[0][0]) for c in mock_conn.execute.call_args_list]
+        assert statements[0].startswith("CREATE TABLE")
+        assert statements[1].endswith('ADD COLUMN "email" VARCHAR')
+
+    @pytest.mark.parametrize("unlogged_bulk", [True, False])
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_unlogged_bulk_overwrite(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        unlogged_bulk: bool,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that unlogged_bulk loads into an UNLOGGED table set LOGGED on close."""
+        from sqlalchemy.engine import Engine
+
+        destination_config.unlogged_bulk = unlogged_bulk
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_inspect.return_value.get_columns.return_value = []
+
+        connector = PostgresConnector(destination_config)
+        state = State(metadata={"full_refresh": True})
+        connector.write_batch(sample_batch, state)
+        connector.write_batch(sample_batch, state)
+        connector.close()
+
+        statements = [str(c[0][0]) for c in mock_conn.execute.call_args_list]
+        if unlogged_bulk:
+            assert statements == [
+                'DROP TABLE IF EXISTS "public"."users"',
+                'CREATE UNLOGGED TABLE IF NOT EXISTS "public"."users" '
+                '("id" BIGINT, "name" VARCHAR)',
+                "SET LOCAL synchronous_commit TO OFF",
+                "SET LOCAL synchronous_commit TO OFF",
+                'ALTER TABLE "public"."users" SET LOGGED',
+            ]
+        else:
+            assert statements == [
+                'DROP TABLE IF EXISTS "public"."users"',
+                'CREATE TABLE IF NOT EXISTS "public"."users" '
+                '("id" BIGINT, "name" VARCHAR)',
+            ]
+        mock_engine.dispose.assert_called_once()
+
+    @patch("dataloader.connectors.postgres.connector.PostgresConnector._insert_batch")
+    @patch("dataloader.connectors.postgres.connector.create_engine")
+    @patch("dataloader.connectors.postgres.connector.inspect")
+    def test_unlogged_bulk_overwrite_creates_missing_table(
+        self,
+        mock_inspect: MagicMock,
+        mock_create_engine: MagicMock,
+        mock_insert_batch: MagicMock,
+        destination_config: DestinationConfig,
+        sample_batch: ArrowBatch,
+    ):
+        """Test that overwrite into a missing table creates it without TRUNCATE."""
+        from sqlalchemy.engine import Engine
+        from sqlalchemy.exc import ProgrammingError
+
+        destination_config.unlogged_bulk = True
+
+        mock_engine = MagicMock(spec=Engine)
+        mock_create_engine.return_value = mock_engine
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
+        mock_inspect.return_value.get_columns.return_value = []
+
+        def execute(statement, *args, **kwargs):
+            # On PostgreSQL, TRUNCATE of a missing table aborts the transaction
+            if str(statement).startswith("TRUNCATE"):
+                raise ProgrammingError(str(statement), {}, Exception("missing"))
+
+        mock_conn.execute.side_effect = execute
+
+        connector = PostgresConnector(destination_config)
+        connector.write_batch(sample_batch, State())
+        connector.close()
+
+        statements = [str(c[0][0]) for c in mock_conn.execute.call_args_list]
+        assert statements == [
+            'CREATE UNLOGGED TABLE IF NOT EXISTS "public"."users" '
+            '("id" BIGINT, "name" VARCHAR)',
+            "SET LOCAL synchronous_commit TO OFF",
+            'ALTER TABLE "public"."users" SET LOGGED',
+        ]
+        mock_insert_batch.assert_called_once()
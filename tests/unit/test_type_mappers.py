@@ -78,6 +78,15 @@ class TestDuckDBTypeMapper:
         assert mapper.arrow_to_connector_type(pa.timestamp("us")) == "TIMESTAMP"
         assert mapper.arrow_to_connector_type(pa.date32()) == "DATE"
 
+    def test_arrow_to_duckdb_parameterized_types(self):
+        """Test that parameterized and less common Arrow types map by type id."""
+        mapper = DuckDBTypeMapper()
+        assert mapper.arrow_to_connector_type(pa.timestamp("ns", "UTC")) == "TIMESTAMP"
+        assert mapper.arrow_to_connector_type(pa.date64()) == "DATE"
+        assert mapper.arrow_to_connector_type(pa.int16()) == "INTEGER"
+        assert mapper.arrow_to_connector_type(pa.float16()) == "FLOAT"
+        assert mapper.arrow_to_connector_type(pa.binary()) == "VARCHAR"
+
     def test_duckdb_to_arrow_bidirectional(self):
         """Test bidirectional mapping DuckDB to Arrow."""
         mapper = DuckDBTypeMapper()